@@ -1,24 +1,23 @@
 """
 Alembic environment configuration.
 
-This env.py is configured for Async SQLAlchemy (asyncpg) and reads DATABASE_URL from
-application settings (env/.env). It also imports the project's `Base` metadata so
-autogenerate works once models are added.
+This env.py reads DATABASE_URL from application settings (env/.env) and imports the
+project's `Base` metadata so autogenerate works.
+
+The app runtime uses an async driver (asyncpg), but migrations are plain DDL with no
+concurrency to exploit, so they run on a synchronous psycopg engine: no event loop or
+greenlet bridge to spin up per invocation.
 """
 
 from __future__ import annotations
 
-import asyncio
 from logging.config import fileConfig
-from typing import Optional
 
 from alembic import context
-from sqlalchemy import pool
-from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy import create_engine, pool
+from sqlalchemy.engine import URL, Connection, make_url
 
 from app.core.config import Settings, get_settings
-from app.db.session import _build_engine
 from app.models.base import Base
 
 # Alembic Config object, provides access to values in alembic.ini.
@@ -42,6 +41,32 @@ def _get_database_url() -> str:
     return settings.DATABASE_URL
 
 
+# DATABASE_URL query options understood only by the asyncpg dialect/driver; psycopg rejects
+# them as invalid connection options.
+_ASYNCPG_ONLY_QUERY_KEYS = (
+    "prepared_statement_cache_size",
+    "prepared_statement_name_func",
+    "statement_cache_size",
+    "max_cached_statement_lifetime",
+    "max_cacheable_statement_size",
+    "command_timeout",
+)
+
+
+def _sync_database_url(database_url: str) -> URL:
+    """
+    Map an async Postgres URL (e.g. postgresql+asyncpg://) to the sync psycopg driver.
+
+    asyncpg-only query options (e.g. `prepared_statement_cache_size`) are dropped.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "postgresql":
+        url = url.set(drivername="postgresql+psycopg").difference_update_query(
+            _ASYNCPG_ONLY_QUERY_KEYS
+        )
+    return url
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode (generates SQL without DB connection)."""
     url = _get_database_url()
@@ -69,23 +94,18 @@ def do_run_migrations(connection: Connection) -> None:
         context.run_migrations()
 
 
-async def run_migrations_online() -> None:
-    """Run migrations in 'online' mode using an AsyncEngine."""
-    database_url = _get_database_url()
-    connectable: AsyncEngine = _build_engine(database_url)
-
-    async with connectable.connect() as async_connection:
-        await async_connection.run_sync(do_run_migrations)
-
-    await connectable.dispose()
-
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode using a synchronous engine."""
+    connectable = create_engine(_sync_database_url(_get_database_url()), poolclass=pool.NullPool)
 
-def run_migrations_online_entrypoint() -> None:
-    """Entrypoint invoked by Alembic."""
-    asyncio.run(run_migrations_online())
+    try:
+        with connectable.connect() as connection:
+            do_run_migrations(connection)
+    finally:
+        connectable.dispose()
 
 
 if context.is_offline_mode():
     run_migrations_offline()
 else:
-    run_migrations_online_entrypoint()
+    run_migrations_online()
@@ -0,0 +1,74 @@
+"""Replace low-cardinality single-column indexes with project-scoped composites.
+
+Revision ID: 0003_project_scoped_indexes
+Revises: 0002_core_domain_tables
+Create Date: 2026-10-15
+
+Standalone btree indexes on `status` / `severity` are rarely selective enough to be used,
+yet every INSERT/UPDATE pays to maintain them. List queries filter by project first, so
+composite indexes led by `project_id` serve both the project filter (and FK lookups) and
+the status/severity refinements. The standalone `project_id` indexes become redundant.
+
+Indexes are built/dropped CONCURRENTLY (outside the migration transaction) so populated
+tables keep accepting writes while this runs.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003_project_scoped_indexes"
+down_revision = "0002_core_domain_tables"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_project_status",
+            "tasks",
+            ["project_id", "status"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_tasks_status", table_name="tasks", postgresql_concurrently=True)
+        op.drop_index("ix_tasks_project_id", table_name="tasks", postgresql_concurrently=True)
+
+        op.create_index(
+            "ix_vulnerabilities_project_severity_status",
+            "vulnerabilities",
+            ["project_id", "severity", "status"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        for name in (
+            "ix_vulnerabilities_status",
+            "ix_vulnerabilities_severity",
+            "ix_vulnerabilities_project_id",
+        ):
+            op.drop_index(name, table_name="vulnerabilities", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+    with op.get_context().autocommit_block():
+        for name, column in (
+            ("ix_vulnerabilities_project_id", "project_id"),
+            ("ix_vulnerabilities_severity", "severity"),
+            ("ix_vulnerabilities_status", "status"),
+        ):
+            op.create_index(
+                name, "vulnerabilities", [column], unique=False, postgresql_concurrently=True
+            )
+        op.drop_index(
+            "ix_vulnerabilities_project_severity_status",
+            table_name="vulnerabilities",
+            postgresql_concurrently=True,
+        )
+
+        for name, column in (("ix_tasks_project_id", "project_id"), ("ix_tasks_status", "status")):
+            op.create_index(name, "tasks", [column], unique=False, postgresql_concurrently=True)
+        op.drop_index("ix_tasks_project_status", table_name="tasks", postgresql_concurrently=True)
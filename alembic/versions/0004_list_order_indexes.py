@@ -0,0 +1,97 @@
+"""Extend list indexes with the `created_at DESC` sort key.
+
+Revision ID: 0004_list_order_indexes
+Revises: 0003_project_scoped_indexes
+Create Date: 2026-10-15
+
+List endpoints filter by project/status(/severity) and return newest first. The page
+query carries no window or total (totals are counted separately, and only when the page
+cannot tell them), so with `created_at DESC` appended to the project-scoped composites the
+planner reads matching rows already in list order and stops at LIMIT, for offset and cursor
+pages alike. That holds when every leading equality column is filtered (project_id and
+status for tasks; project_id, severity and status for vulnerabilities); a shorter prefix
+still narrows the scan but needs a sort. The project list (no filters) gets its own
+`created_at DESC` index for the same reason. The previous composites are prefixes of the
+new ones and are dropped.
+
+Indexes are built/dropped CONCURRENTLY (outside the migration transaction) so populated
+tables keep accepting writes while this runs.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_list_order_indexes"
+down_revision = "0003_project_scoped_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_projects_created_at",
+            "projects",
+            [sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+        op.create_index(
+            "ix_tasks_project_status_created",
+            "tasks",
+            ["project_id", "status", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_tasks_project_status", table_name="tasks", postgresql_concurrently=True)
+
+        op.create_index(
+            "ix_vulnerabilities_project_severity_status_created",
+            "vulnerabilities",
+            ["project_id", "severity", "status", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_vulnerabilities_project_severity_status",
+            table_name="vulnerabilities",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_vulnerabilities_project_severity_status",
+            "vulnerabilities",
+            ["project_id", "severity", "status"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_vulnerabilities_project_severity_status_created",
+            table_name="vulnerabilities",
+            postgresql_concurrently=True,
+        )
+
+        op.create_index(
+            "ix_tasks_project_status",
+            "tasks",
+            ["project_id", "status"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_tasks_project_status_created", table_name="tasks", postgresql_concurrently=True
+        )
+
+        op.drop_index(
+            "ix_projects_created_at", table_name="projects", postgresql_concurrently=True
+        )
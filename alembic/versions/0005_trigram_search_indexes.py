@@ -0,0 +1,60 @@
+"""Back the text search filters with pg_trgm GIN indexes.
+
+Revision ID: 0005_trigram_search_indexes
+Revises: 0004_list_order_indexes
+Create Date: 2026-10-15
+
+The `q` filters on list endpoints are unanchored case-insensitive "contains" matches
+(`ILIKE '%q%'`), which btree indexes cannot serve, so every search scanned the table.
+Trigram GIN indexes answer ILIKE/LIKE '%q%' directly while keeping the existing match
+semantics. The btree indexes on `projects.name` / `tasks.title` / `vulnerabilities.title`
+served no query and are dropped.
+
+Requires the `pg_trgm` extension (shipped with PostgreSQL contrib); indexes are built and
+dropped CONCURRENTLY so populated tables keep accepting writes.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005_trigram_search_indexes"
+down_revision = "0004_list_order_indexes"
+branch_labels = None
+depends_on = None
+
+# (index name, table, column, replaced btree index)
+_TRGM_INDEXES = (
+    ("ix_projects_name_trgm", "projects", "name", "ix_projects_name"),
+    ("ix_tasks_title_trgm", "tasks", "title", "ix_tasks_title"),
+    ("ix_vulnerabilities_title_trgm", "vulnerabilities", "title", "ix_vulnerabilities_title"),
+)
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for name, table, column, btree_name in _TRGM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+            op.drop_index(btree_name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Revert the migration (the pg_trgm extension is left installed)."""
+    with op.get_context().autocommit_block():
+        for name, table, column, btree_name in reversed(_TRGM_INDEXES):
+            op.create_index(
+                btree_name, table, [column], unique=False, postgresql_concurrently=True
+            )
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
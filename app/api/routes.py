@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any, Dict
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
+
+from app.common.clock import utc_timestamp
 
 router = APIRouter(tags=["Root"])
 
+# Static response bodies, built once at import (never mutated).
+_ROOT_BODY = orjson.dumps({"message": "rest-api-modernized API is running"})
+_INFO_STATIC: Dict[str, Any] = {"service": "rest-api-modernized", "version": "unknown"}
+
 
 @router.get(
     "/",
     summary="API root",
     description="Basic API root endpoint that returns a welcome message.",
     operation_id="api_root",
+    response_model=None,
 )
-async def api_root() -> Dict[str, Any]:
+async def api_root() -> Response:
     """
     PUBLIC_INTERFACE
     API root endpoint.
@@ -24,7 +31,7 @@ async def api_root() -> Dict[str, Any]:
     Returns:
         A JSON object with a short message indicating the API is running.
     """
-    return {"message": "rest-api-modernized API is running"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @router.get(
@@ -32,8 +39,9 @@ async def api_root() -> Dict[str, Any]:
     summary="Service info (unprefixed)",
     description="Returns service metadata such as name, version, and timestamp.",
     operation_id="api_info_unprefixed",
+    response_model=None,
 )
-async def api_info() -> Dict[str, Any]:
+async def api_info() -> Response:
     """
     PUBLIC_INTERFACE
     Service metadata endpoint (unprefixed variant).
@@ -41,8 +49,5 @@ async def api_info() -> Dict[str, Any]:
     Returns:
         A JSON object with service metadata.
     """
-    return {
-        "service": "rest-api-modernized",
-        "version": "unknown",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+    body = orjson.dumps({**_INFO_STATIC, "timestamp": utc_timestamp()})
+    return Response(content=body, media_type="application/json")
@@ -2,21 +2,60 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, FrozenSet, Optional, Sequence, Set
-
-import jwt
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Sequence, Set, Tuple
+
+import orjson
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jwt.exceptions import InvalidTokenError
-
-from app.auth.oidc import fetch_jwks
-from app.core.config import Settings, get_settings
+from jwt.exceptions import (
+    DecodeError,
+    ExpiredSignatureError,
+    ImmatureSignatureError,
+    InvalidAudienceError,
+    InvalidIssuerError,
+    InvalidSignatureError,
+    InvalidTokenError,
+    MissingRequiredClaimError,
+)
+
+from app.auth.oidc import fetch_signing_keys
+from app.core.config import Settings
+from app.dependencies.settings import get_app_settings
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Standard registered claims required on access tokens.
+_REQUIRED_CLAIMS: Tuple[str, ...] = ("exp", "iat", "iss", "sub")
+# Allowed clock skew (seconds) for exp/nbf/iat checks; matches PyJWT's default.
+_LEEWAY_SECONDS = 0.0
+
+
+# Recently verified tokens (keyed by a token digest) so bursts of requests carrying the same
+# access token skip RSA verification. Entries live at most _TOKEN_CACHE_TTL_SECONDS (and never
+# past the token's `exp`), which bounds how long a revoked token keeps being accepted.
+_TOKEN_CACHE_MAX_ENTRIES = 10_000
+_TOKEN_CACHE_TTL_SECONDS = 30.0
+
+_EMPTY_CLAIMS: Mapping[str, Any] = MappingProxyType({})
+
+
+# Realm/client roles treated as administrators by the service layer.
+ADMIN_ROLES: FrozenSet[str] = frozenset({"admin", "realm-admin"})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AuthenticatedUser:
     """Represents the authenticated principal extracted from an access token."""
 
@@ -26,15 +65,44 @@ class AuthenticatedUser:
     issuer: str
     audience: Optional[str]
     roles: FrozenSet[str] = field(default_factory=frozenset)
-    raw_claims: Dict[str, Any] = field(default_factory=dict)
+    # Read-only view over the decoded claims (no copy).
+    raw_claims: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_CLAIMS)
+    # Derived once at construction (principals are cached per token and reused).
+    is_admin: bool = field(init=False, repr=False, compare=False)
+    # `roles` in a stable order for responses, so endpoints do not sort per request.
+    roles_sorted: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "is_admin", not self.roles.isdisjoint(ADMIN_ROLES))
+        object.__setattr__(self, "roles_sorted", tuple(sorted(self.roles)))
+
+
+_TOKEN_CACHE: "OrderedDict[bytes, Tuple[AuthenticatedUser, float]]" = OrderedDict()
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 
+def _token_cache_get(key: bytes) -> Optional[AuthenticatedUser]:
+    """Return a cached principal for the token digest, if present and not expired."""
+    hit = _TOKEN_CACHE.get(key)
+    if hit is None:
+        return None
+    user, expires_at = hit
+    if expires_at <= time.time():
+        _TOKEN_CACHE.pop(key, None)
+        return None
+    _TOKEN_CACHE.move_to_end(key)
+    return user
 
-def _resolve_audience(settings: Settings) -> str:
-    """Resolve audience from current settings, allowing deprecated KEYCLOAK_* fallbacks."""
-    aud = (settings.OIDC_AUDIENCE or "").strip()
-    if not aud:
-        aud = (settings.KEYCLOAK_AUDIENCE or "").strip()
-    return aud
+
+def _token_cache_put(key: bytes, user: AuthenticatedUser, *, exp: float) -> None:
+    """Cache a verified principal until min(token exp, now + TTL), evicting LRU entries."""
+    _TOKEN_CACHE[key] = (user, min(float(exp), time.time() + _TOKEN_CACHE_TTL_SECONDS))
+    _TOKEN_CACHE.move_to_end(key)
+    while len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX_ENTRIES:
+        _TOKEN_CACHE.popitem(last=False)
 
 
 def _extract_roles_from_keycloak_claims(claims: Dict[str, Any], *, client_id: str) -> Set[str]:
@@ -43,60 +111,176 @@ def _extract_roles_from_keycloak_claims(claims: Dict[str, Any], *, client_id: st
 
     - realm roles: realm_access.roles
     - client roles: resource_access[client_id].roles
+    - direct roles: roles (some deployments; included best effort)
+
+    Keycloak role names are strings; non-string entries are ignored.
     """
+    paths: Tuple[Tuple[str, ...], ...] = (("realm_access", "roles"), ("roles",))
+    if client_id:
+        paths += (("resource_access", client_id, "roles"),)
+
     roles: Set[str] = set()
+    for path in paths:
+        value: Any = claims
+        for key in path:
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(key)
+        if isinstance(value, list):
+            roles.update(r for r in value if isinstance(r, str))
+    return roles
 
-    realm_access = claims.get("realm_access")
-    if isinstance(realm_access, dict):
-        realm_roles = realm_access.get("roles")
-        if isinstance(realm_roles, list):
-            roles |= {str(r) for r in realm_roles if isinstance(r, (str, int))}
-
-    resource_access = claims.get("resource_access")
-    if isinstance(resource_access, dict) and client_id:
-        client_access = resource_access.get(client_id)
-        if isinstance(client_access, dict):
-            client_roles = client_access.get("roles")
-            if isinstance(client_roles, list):
-                roles |= {str(r) for r in client_roles if isinstance(r, (str, int))}
-
-    # Some deployments also use "roles" or "groups"; include lightly (best effort).
-    direct_roles = claims.get("roles")
-    if isinstance(direct_roles, list):
-        roles |= {str(r) for r in direct_roles if isinstance(r, (str, int))}
 
-    return roles
+def _get_token_kid(header: Mapping[str, Any]) -> str:
+    """Return the `kid` from the (unverified) JWT header."""
+    kid = header.get("kid")
+    if not kid:
+        raise InvalidTokenError("JWT header missing 'kid'.")
+    return str(kid)
 
 
-def _get_signing_key_from_jwks(token: str, jwks: Dict[str, Any]) -> Any:
+def _get_signing_key_from_jwks(kid: str, keys_by_kid: Mapping[str, Any]) -> Any:
     """
-    Resolve a public key for the JWT `kid` using JWKS.
+    Resolve a public key for the JWT `kid` from the pre-parsed JWKS key map.
 
-    We use PyJWT's PyJWKClient in-memory by feeding it a JWKS URL is not possible here,
-    so we construct keys directly from the JWKS dict.
+    Keys are parsed once per JWKS fetch (see `app.auth.oidc.fetch_signing_keys`), so this
+    is a dict lookup rather than a per-request JWK -> RSA key reconstruction.
     """
-    # PyJWT exposes a JWK set helper internally via PyJWKClient, but it expects a URL fetcher.
-    # Instead, we parse the header to find kid and select the matching JWK.
-    unverified_header = jwt.get_unverified_header(token)
-    kid = unverified_header.get("kid")
-    if not kid:
-        raise InvalidTokenError("JWT header missing 'kid'.")
+    try:
+        return keys_by_kid[kid]
+    except KeyError:
+        raise InvalidTokenError("No matching JWK found for token kid.") from None
+
+
+def _b64url_decode(segment: bytes) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+    except (binascii.Error, ValueError) as exc:
+        raise DecodeError("Invalid token segment encoding.") from exc
 
-    keys = jwks.get("keys")
-    if not isinstance(keys, list):
-        raise InvalidTokenError("JWKS missing 'keys' list.")
 
-    for jwk_dict in keys:
-        if isinstance(jwk_dict, dict) and jwk_dict.get("kid") == kid:
-            return jwt.algorithms.RSAAlgorithm.from_jwk(jwk_dict)
+def _load_json_object(raw: bytes, what: str) -> Dict[str, Any]:
+    try:
+        value = orjson.loads(raw)
+    except orjson.JSONDecodeError as exc:
+        raise DecodeError(f"Invalid {what} JSON.") from exc
+    if not isinstance(value, dict):
+        raise DecodeError(f"Invalid {what}: must be a JSON object.")
+    return value
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _validate_claims(claims: Dict[str, Any], *, audience: str, issuer: str) -> None:
+    """Check registered claims the way `jwt.decode` would for our fixed options."""
+    for name in _REQUIRED_CLAIMS:
+        if name not in claims:
+            raise MissingRequiredClaimError(name)
+
+    now = time.time()
+
+    exp = claims["exp"]
+    if not _is_number(exp):
+        raise DecodeError("Expiration Time claim (exp) must be a number.")
+    if exp <= now - _LEEWAY_SECONDS:
+        raise ExpiredSignatureError("Signature has expired")
+
+    iat = claims["iat"]
+    if not _is_number(iat):
+        raise ImmatureSignatureError("Issued At claim (iat) must be a number.")
+    if iat > now + _LEEWAY_SECONDS:
+        raise ImmatureSignatureError("The token is not yet valid (iat)")
+
+    nbf = claims.get("nbf")
+    if nbf is not None:
+        if not _is_number(nbf):
+            raise DecodeError("Not Before claim (nbf) must be a number.")
+        if nbf > now + _LEEWAY_SECONDS:
+            raise ImmatureSignatureError("The token is not yet valid (nbf)")
+
+    if claims["iss"] != issuer:
+        raise InvalidIssuerError("Invalid issuer")
+
+    aud = claims.get("aud")
+    if aud is None:
+        raise MissingRequiredClaimError("aud")
+    if isinstance(aud, str):
+        aud = [aud]
+    if not isinstance(aud, list) or not all(isinstance(a, str) for a in aud):
+        raise InvalidAudienceError("Invalid claim format in token")
+    if audience not in aud:
+        raise InvalidAudienceError("Audience doesn't match")
+
+
+@dataclass(frozen=True, slots=True)
+class _CompactJWS:
+    """A compact JWS split once: parsed header plus the raw segments needed to verify."""
+
+    header: Dict[str, Any]
+    signing_input: bytes
+    payload_b64: bytes
+    signature_b64: bytes
+
+
+def _split_jws(token: str) -> _CompactJWS:
+    """Split a compact JWS and parse its (unverified) header exactly once."""
+    try:
+        header_b64, payload_b64, signature_b64 = token.encode("ascii").split(b".")
+    except UnicodeEncodeError:
+        raise DecodeError("Invalid token encoding.") from None
+    except ValueError:
+        raise DecodeError("Not enough segments") from None
+
+    return _CompactJWS(
+        header=_load_json_object(_b64url_decode(header_b64), "header"),
+        signing_input=header_b64 + b"." + payload_b64,
+        payload_b64=payload_b64,
+        signature_b64=signature_b64,
+    )
+
+
+def _verify_rs256(
+    jws: _CompactJWS, public_key: Any, *, audience: str, issuer: str
+) -> Dict[str, Any]:
+    """
+    Verify an RS256 compact JWS with the `cryptography` API and validate its claims.
+
+    The key is already parsed from JWKS, so this skips PyJWT's generic algorithm dispatch and
+    option handling; the RSA verification itself is done by OpenSSL either way.
+    """
+    if not isinstance(public_key, RSAPublicKey):
+        raise InvalidTokenError("Signing key is not an RSA public key.")
+
+    if jws.header.get("alg") != "RS256":
+        raise InvalidSignatureError("The specified alg value is not allowed")
 
-    raise InvalidTokenError("No matching JWK found for token kid.")
+    # RFC 7515 §4.1.11: reject tokens whose `crit` names extensions we do not understand.
+    # No JWS extensions are supported here, so any `crit` (an empty list is invalid too).
+    if "crit" in jws.header:
+        raise InvalidTokenError("Unsupported critical extension")
+
+    try:
+        public_key.verify(
+            _b64url_decode(jws.signature_b64),
+            jws.signing_input,
+            padding.PKCS1v15(),
+            hashes.SHA256(),
+        )
+    except InvalidSignature:
+        raise InvalidSignatureError("Signature verification failed") from None
+
+    claims = _load_json_object(_b64url_decode(jws.payload_b64), "payload")
+    _validate_claims(claims, audience=audience, issuer=issuer)
+    return claims
 
 
 # PUBLIC_INTERFACE
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
-    settings: Settings = Depends(get_settings),
+    settings: Settings = Depends(get_app_settings),
 ) -> AuthenticatedUser:
     """
     PUBLIC_INTERFACE
@@ -106,6 +290,7 @@ async def get_current_user(
     - Uses OIDC discovery -> jwks_uri -> JWKS keys
     - Verifies RS256 signature and standard claims
     - Extracts realm/client roles from Keycloak claim conventions
+    - Briefly caches the verified principal per token (<= 30s, never past `exp`)
 
     Args:
         credentials: HTTP Authorization bearer credentials extracted by FastAPI.
@@ -125,36 +310,36 @@ async def get_current_user(
 
     token = credentials.credentials
 
-    issuer = (settings.OIDC_ISSUER_URL or settings.KEYCLOAK_ISSUER_URL or "").rstrip("/")
+    issuer = settings.oidc_issuer
     if not issuer:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Server auth misconfiguration: OIDC_ISSUER_URL is not set.",
         )
 
-    audience = _resolve_audience(settings)
+    audience = settings.oidc_audience
     if not audience:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Server auth misconfiguration: OIDC_AUDIENCE is not set.",
         )
 
+    cache_key = _token_cache_key(token)
+    cached_user = _token_cache_get(cache_key)
+    if cached_user is not None:
+        return cached_user
+
     # Fetch/cached JWKS and validate signature + claims
     try:
-        jwks = await fetch_jwks(settings=settings)
-        signing_key = _get_signing_key_from_jwks(token, jwks)
-
-        claims: Dict[str, Any] = jwt.decode(
-            token,
-            key=signing_key,
-            algorithms=["RS256"],
-            audience=audience,
-            issuer=issuer,
-            options={
-                # Require standard registered claims typical for access tokens
-                "require": ["exp", "iat", "iss", "sub"],
-            },
-        )
+        jws = _split_jws(token)
+        kid = _get_token_kid(jws.header)
+        keys_by_kid = await fetch_signing_keys(settings=settings)
+        if kid not in keys_by_kid:
+            # Unknown kid: the IdP may have rotated keys since our last fetch.
+            keys_by_kid = await fetch_signing_keys(settings=settings, force_refresh=True)
+        signing_key = _get_signing_key_from_jwks(kid, keys_by_kid)
+
+        claims = _verify_rs256(jws, signing_key, audience=audience, issuer=issuer)
     except InvalidTokenError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -176,8 +361,7 @@ async def get_current_user(
     email_val = claims.get("email")
     email = str(email_val) if email_val is not None else None
 
-    client_id = (settings.OIDC_CLIENT_ID or "").strip()
-    roles = _extract_roles_from_keycloak_claims(claims, client_id=client_id)
+    roles = _extract_roles_from_keycloak_claims(claims, client_id=settings.oidc_client_id)
 
     aud_claim = claims.get("aud")
     aud_str = None
@@ -186,15 +370,17 @@ async def get_current_user(
     elif isinstance(aud_claim, list) and aud_claim:
         aud_str = str(aud_claim[0])
 
-    return AuthenticatedUser(
+    user = AuthenticatedUser(
         subject=subject,
         username=username,
         email=email,
         issuer=str(claims.get("iss", issuer)),
         audience=aud_str,
-        roles=frozenset(sorted(roles)),
-        raw_claims=claims,
+        roles=frozenset(roles),
+        raw_claims=MappingProxyType(claims),
     )
+    _token_cache_put(cache_key, user, exp=claims["exp"])
+    return user
 
 
 # PUBLIC_INTERFACE
@@ -215,19 +401,38 @@ def require_roles(required: Sequence[str]) -> Any:
     Raises:
         HTTPException(403): If user lacks required roles.
     """
-    required_set = {r for r in required if isinstance(r, str) and r.strip()}
-    required_frozen: FrozenSet[str] = frozenset(required_set)
+    normalized: Tuple[str, ...] = tuple(
+        sorted({r for r in required if isinstance(r, str) and r.strip()})
+    )
+    return _require_roles_dependency(normalized)
 
-    async def _dependency(user: AuthenticatedUser = Depends(get_current_user)) -> AuthenticatedUser:
-        if not required_frozen:
-            return user
 
-        if user.roles.intersection(required_frozen):
+@cache
+def _require_roles_dependency(required: Tuple[str, ...]) -> Any:
+    """
+    Build (once per normalized role tuple) the dependency returned by `require_roles`.
+
+    Returning the same callable for the same roles lets FastAPI's dependency cache dedupe it
+    across routes. With no roles, `get_current_user` itself is returned.
+    """
+    if not required:
+        return get_current_user
+
+    required_frozen: FrozenSet[str] = frozenset(required)
+    forbidden_detail = f"Missing required role(s): {list(required)}"
+
+    async def _dependency(user: AuthenticatedUser = Depends(get_current_user)) -> AuthenticatedUser:
+        if not user.roles.isdisjoint(required_frozen):
             return user
 
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Missing required role(s): {sorted(required_frozen)}",
+            detail=forbidden_detail,
         )
 
     return _dependency
+
+
+# PUBLIC_INTERFACE
+# Dependency for admin-only endpoints (any of ADMIN_ROLES), built once at import.
+require_admin = require_roles(tuple(ADMIN_ROLES))
@@ -2,27 +2,85 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 import httpx
+import jwt
+import orjson
+from jwt.exceptions import InvalidKeyError
 
 from app.core.config import Settings, get_settings
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class _CacheEntry:
     value: Dict[str, Any]
     expires_at: float
+    fetched_at: float = 0.0
+    # Parsed public keys (JWKS only), built once per fetch so requests do a dict lookup.
+    keys_by_kid: Dict[str, Any] = field(default_factory=dict)
 
 
 _DISCOVERY_CACHE: Optional[_CacheEntry] = None
 _JWKS_CACHE: Optional[_CacheEntry] = None
 
+# Lower bound between forced JWKS refreshes (kid-rollover recovery), so tokens carrying
+# unknown `kid` values cannot turn every request into an IdP round-trip.
+_JWKS_MIN_REFRESH_INTERVAL_SECONDS = 30.0
+
+# Entries this close to expiry are still served, but trigger a background refresh
+# (stale-while-revalidate) so requests rarely wait on the IdP.
+_REFRESH_AHEAD_SECONDS = 15.0
+
+# In-flight fetches keyed by cache name; concurrent cache misses await the same task.
+_INFLIGHT: Dict[str, "asyncio.Task[_CacheEntry]"] = {}
+
+# Background JWKS refresher (started from the app lifespan): refresh this long before expiry,
+# capped at half the TTL; retry sooner after failures.
+_REFRESHER_MARGIN_SECONDS = 60.0
+_REFRESHER_MIN_SLEEP_SECONDS = 5.0
+_REFRESHER_RETRY_SECONDS = 30.0
+_REFRESHER_TASK: Optional["asyncio.Task[None]"] = None
+
+# Process-wide client so refreshes reuse pooled keep-alive connections (no TLS handshake).
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it lazily."""
+    global _HTTP_CLIENT  # noqa: PLW0603
+
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+        )
+    return _HTTP_CLIENT
+
+
+# PUBLIC_INTERFACE
+async def close_http_client() -> None:
+    """
+    PUBLIC_INTERFACE
+    Close the shared OIDC HTTP client (call on application shutdown).
+    """
+    global _HTTP_CLIENT  # noqa: PLW0603
+
+    client = _HTTP_CLIENT
+    _HTTP_CLIENT = None
+    if client is not None:
+        await client.aclose()
+
 
 def _now() -> float:
-    return time.time()
+    return time.monotonic()
 
 
 def _cache_get(entry: Optional[_CacheEntry]) -> Optional[Dict[str, Any]]:
@@ -33,16 +91,100 @@ def _cache_get(entry: Optional[_CacheEntry]) -> Optional[Dict[str, Any]]:
     return entry.value
 
 
-def _cache_set(value: Dict[str, Any], ttl_seconds: int) -> _CacheEntry:
-    return _CacheEntry(value=value, expires_at=_now() + ttl_seconds)
+def _cache_set(
+    value: Dict[str, Any], ttl_seconds: int, *, keys_by_kid: Optional[Dict[str, Any]] = None
+) -> _CacheEntry:
+    now = _now()
+    return _CacheEntry(
+        value=value,
+        expires_at=now + ttl_seconds,
+        fetched_at=now,
+        keys_by_kid=keys_by_kid or {},
+    )
+
+
+def _build_keys_by_kid(jwks: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse the RSA keys of a JWKS document into public-key objects keyed by `kid`."""
+    keys = jwks.get("keys")
+    if not isinstance(keys, list):
+        raise RuntimeError("JWKS missing 'keys' list.")
+
+    keys_by_kid: Dict[str, Any] = {}
+    for jwk_dict in keys:
+        if not isinstance(jwk_dict, dict):
+            continue
+        kid = jwk_dict.get("kid")
+        if not isinstance(kid, str) or jwk_dict.get("kty") != "RSA":
+            continue
+        try:
+            keys_by_kid[kid] = jwt.algorithms.RSAAlgorithm.from_jwk(jwk_dict)
+        except (InvalidKeyError, ValueError, TypeError, KeyError):
+            # Skip malformed keys; a token signed with one will fail the kid lookup.
+            continue
+    return keys_by_kid
+
+
+def _needs_refresh_ahead(entry: _CacheEntry) -> bool:
+    return entry.expires_at - _now() < _REFRESH_AHEAD_SECONDS
+
+
+def _on_inflight_done(name: str, task: "asyncio.Task[_CacheEntry]") -> None:
+    if _INFLIGHT.get(name) is task:
+        del _INFLIGHT[name]
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("OIDC %s fetch failed: %s", name, task.exception())
+
+
+async def _single_flight(
+    name: str, fetch: Callable[[], Awaitable[_CacheEntry]]
+) -> _CacheEntry:
+    """
+    Run `fetch` at most once at a time per cache name.
 
+    Concurrent callers await the same in-flight task, so a cache miss under load costs one
+    HTTP round-trip instead of one per request. The task is shielded so a cancelled caller
+    does not abort the fetch for everyone else.
+    """
+    task = _INFLIGHT.get(name)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(fetch())
+        _INFLIGHT[name] = task
+        task.add_done_callback(lambda t: _on_inflight_done(name, t))
+    return await asyncio.shield(task)
+
+
+def _refresh_in_background(name: str, fetch: Callable[[], Awaitable[_CacheEntry]]) -> None:
+    """Start a coalesced background refresh unless one is already running."""
+    task = _INFLIGHT.get(name)
+    if task is not None and not task.done():
+        return
+    task = asyncio.ensure_future(fetch())
+    _INFLIGHT[name] = task
+    task.add_done_callback(lambda t: _on_inflight_done(name, t))
+
+
+async def _fetch_discovery_entry(
+    settings: Settings, http_client: Optional[httpx.AsyncClient]
+) -> _CacheEntry:
+    """Fetch the discovery document from the issuer and store it in the cache."""
+    global _DISCOVERY_CACHE  # noqa: PLW0603
 
-def _resolve_issuer(settings: Settings) -> str:
-    """Resolve issuer URL from current settings, allowing deprecated KEYCLOAK_* fallbacks."""
-    issuer = (settings.OIDC_ISSUER_URL or "").strip()
+    issuer = settings.oidc_issuer
     if not issuer:
-        issuer = (settings.KEYCLOAK_ISSUER_URL or "").strip()
-    return issuer.rstrip("/")
+        raise RuntimeError("OIDC_ISSUER_URL is not configured.")
+
+    discovery_url = f"{issuer}/.well-known/openid-configuration"
+    client = http_client or _get_http_client()
+    try:
+        resp = await client.get(discovery_url, headers={"Accept": "application/json"})
+        resp.raise_for_status()
+        doc = orjson.loads(resp.content)
+        if not isinstance(doc, dict):
+            raise RuntimeError("OIDC discovery response was not a JSON object.")
+        _DISCOVERY_CACHE = _cache_set(doc, settings.OIDC_CACHE_TTL_SECONDS)
+        return _DISCOVERY_CACHE
+    except (httpx.HTTPError, ValueError) as exc:
+        raise RuntimeError(f"Failed to fetch OIDC discovery from {discovery_url}: {exc}") from exc
 
 
 # PUBLIC_INTERFACE
@@ -56,9 +198,12 @@ async def fetch_oidc_discovery(
     This calls:
         {OIDC_ISSUER_URL}/.well-known/openid-configuration
 
+    Concurrent cache misses share a single request; entries close to expiry are served
+    while a background refresh runs.
+
     Args:
         settings: Optional Settings override.
-        http_client: Optional shared httpx AsyncClient.
+        http_client: Optional httpx AsyncClient (defaults to the shared module client).
 
     Returns:
         The discovery JSON document (dict).
@@ -66,42 +211,77 @@ async def fetch_oidc_discovery(
     Raises:
         RuntimeError: If OIDC_ISSUER_URL is not configured or discovery fetch fails.
     """
-    global _DISCOVERY_CACHE  # noqa: PLW0603
-
     resolved_settings = settings or get_settings()
-    cached = _cache_get(_DISCOVERY_CACHE)
-    if cached is not None:
-        return cached
+    entry = _DISCOVERY_CACHE
+    if entry is not None and _cache_get(entry) is not None:
+        if _needs_refresh_ahead(entry):
+            # The caller's client may be closed once it returns; background work uses its own.
+            _refresh_in_background(
+                "discovery", lambda: _fetch_discovery_entry(resolved_settings, None)
+            )
+        return entry.value
+
+    entry = await _single_flight(
+        "discovery", lambda: _fetch_discovery_entry(resolved_settings, http_client)
+    )
+    return entry.value
 
-    issuer = _resolve_issuer(resolved_settings)
-    if not issuer:
-        raise RuntimeError("OIDC_ISSUER_URL is not configured.")
 
-    discovery_url = f"{issuer}/.well-known/openid-configuration"
-    close_client = False
-    client = http_client
-    if client is None:
-        client = httpx.AsyncClient(timeout=10.0)
-        close_client = True
+async def _fetch_jwks_entry(
+    settings: Settings, http_client: Optional[httpx.AsyncClient]
+) -> _CacheEntry:
+    """Fetch the JWKS document (parsing its keys) and store it in the cache."""
+    global _JWKS_CACHE  # noqa: PLW0603
+
+    discovery = await fetch_oidc_discovery(settings=settings, http_client=http_client)
+    jwks_uri = discovery.get("jwks_uri")
+    if not isinstance(jwks_uri, str) or not jwks_uri.strip():
+        raise RuntimeError("OIDC discovery did not include a valid 'jwks_uri'.")
 
+    client = http_client or _get_http_client()
     try:
-        resp = await client.get(discovery_url, headers={"Accept": "application/json"})
+        resp = await client.get(jwks_uri, headers={"Accept": "application/json"})
         resp.raise_for_status()
-        doc = resp.json()
-        if not isinstance(doc, dict):
-            raise RuntimeError("OIDC discovery response was not a JSON object.")
-        _DISCOVERY_CACHE = _cache_set(doc, resolved_settings.OIDC_CACHE_TTL_SECONDS)
-        return doc
+        jwks = orjson.loads(resp.content)
+        if not isinstance(jwks, dict):
+            raise RuntimeError("JWKS response was not a JSON object.")
+        _JWKS_CACHE = _cache_set(
+            jwks,
+            settings.OIDC_CACHE_TTL_SECONDS,
+            keys_by_kid=_build_keys_by_kid(jwks),
+        )
+        return _JWKS_CACHE
     except (httpx.HTTPError, ValueError) as exc:
-        raise RuntimeError(f"Failed to fetch OIDC discovery from {discovery_url}: {exc}") from exc
-    finally:
-        if close_client:
-            await client.aclose()
+        raise RuntimeError(f"Failed to fetch JWKS from {jwks_uri}: {exc}") from exc
+
+
+async def _load_jwks_entry(
+    *,
+    settings: Optional[Settings],
+    http_client: Optional[httpx.AsyncClient],
+    force_refresh: bool,
+) -> _CacheEntry:
+    """Return the cached JWKS entry, fetching (and parsing keys) on miss or forced refresh."""
+    resolved_settings = settings or get_settings()
+    entry = _JWKS_CACHE
+    if entry is not None:
+        if force_refresh:
+            if _now() - entry.fetched_at < _JWKS_MIN_REFRESH_INTERVAL_SECONDS:
+                return entry
+        elif _cache_get(entry) is not None:
+            if _needs_refresh_ahead(entry):
+                _refresh_in_background("jwks", lambda: _fetch_jwks_entry(resolved_settings, None))
+            return entry
+
+    return await _single_flight("jwks", lambda: _fetch_jwks_entry(resolved_settings, http_client))
 
 
 # PUBLIC_INTERFACE
 async def fetch_jwks(
-    *, settings: Optional[Settings] = None, http_client: Optional[httpx.AsyncClient] = None
+    *,
+    settings: Optional[Settings] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
+    force_refresh: bool = False,
 ) -> Dict[str, Any]:
     """
     PUBLIC_INTERFACE
@@ -111,7 +291,8 @@ async def fetch_jwks(
 
     Args:
         settings: Optional Settings override.
-        http_client: Optional shared httpx AsyncClient.
+        http_client: Optional httpx AsyncClient (defaults to the shared module client).
+        force_refresh: Bypass the TTL and refetch (rate-limited to avoid hammering the IdP).
 
     Returns:
         JWKS JSON document.
@@ -119,37 +300,90 @@ async def fetch_jwks(
     Raises:
         RuntimeError: If JWKS fetch fails or discovery is misconfigured.
     """
-    global _JWKS_CACHE  # noqa: PLW0603
+    entry = await _load_jwks_entry(
+        settings=settings, http_client=http_client, force_refresh=force_refresh
+    )
+    return entry.value
+
+
+# PUBLIC_INTERFACE
+async def fetch_signing_keys(
+    *,
+    settings: Optional[Settings] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
+    force_refresh: bool = False,
+) -> Dict[str, Any]:
+    """
+    PUBLIC_INTERFACE
+    Return the JWKS RSA public keys keyed by `kid`.
+
+    Keys are parsed once per JWKS fetch and share the JWKS cache TTL.
+
+    Args:
+        settings: Optional Settings override.
+        http_client: Optional httpx AsyncClient (defaults to the shared module client).
+        force_refresh: Bypass the TTL and refetch, e.g. after a `kid` miss (key rollover).
+
+    Returns:
+        Mapping of `kid` to public-key objects usable with PyJWT.
+
+    Raises:
+        RuntimeError: If JWKS fetch fails or discovery is misconfigured.
+    """
+    entry = await _load_jwks_entry(
+        settings=settings, http_client=http_client, force_refresh=force_refresh
+    )
+    return entry.keys_by_kid
+
+
+async def _jwks_refresher(settings: Settings) -> None:
+    """Keep the JWKS cache warm so request paths never wait on the IdP in steady state."""
+    margin = min(_REFRESHER_MARGIN_SECONDS, settings.OIDC_CACHE_TTL_SECONDS / 2)
+    while True:
+        try:
+            entry = await _single_flight("jwks", lambda: _fetch_jwks_entry(settings, None))
+            delay = entry.expires_at - _now() - margin
+        except Exception:  # noqa: BLE001 - already logged by _on_inflight_done; keep looping.
+            delay = _REFRESHER_RETRY_SECONDS
+        await asyncio.sleep(max(delay, _REFRESHER_MIN_SLEEP_SECONDS))
+
+
+# PUBLIC_INTERFACE
+def start_jwks_refresher(*, settings: Optional[Settings] = None) -> None:
+    """
+    PUBLIC_INTERFACE
+    Start the background JWKS refresh task (call from the app lifespan startup).
+
+    The task fetches immediately (warming the cache) and then re-fetches shortly before each
+    expiry. It is a no-op when no issuer is configured or the task is already running.
+    """
+    global _REFRESHER_TASK  # noqa: PLW0603
 
     resolved_settings = settings or get_settings()
-    cached = _cache_get(_JWKS_CACHE)
-    if cached is not None:
-        return cached
+    if not resolved_settings.oidc_issuer:
+        return
+    if _REFRESHER_TASK is not None and not _REFRESHER_TASK.done():
+        return
+    _REFRESHER_TASK = asyncio.create_task(_jwks_refresher(resolved_settings))
 
-    discovery = await fetch_oidc_discovery(settings=resolved_settings, http_client=http_client)
-    jwks_uri = discovery.get("jwks_uri")
-    if not isinstance(jwks_uri, str) or not jwks_uri.strip():
-        raise RuntimeError("OIDC discovery did not include a valid 'jwks_uri'.")
 
-    close_client = False
-    client = http_client
-    if client is None:
-        client = httpx.AsyncClient(timeout=10.0)
-        close_client = True
+# PUBLIC_INTERFACE
+async def stop_jwks_refresher() -> None:
+    """
+    PUBLIC_INTERFACE
+    Cancel the background JWKS refresh task (call from the app lifespan shutdown).
+    """
+    global _REFRESHER_TASK  # noqa: PLW0603
 
+    task = _REFRESHER_TASK
+    _REFRESHER_TASK = None
+    if task is None:
+        return
+    task.cancel()
     try:
-        resp = await client.get(jwks_uri, headers={"Accept": "application/json"})
-        resp.raise_for_status()
-        jwks = resp.json()
-        if not isinstance(jwks, dict):
-            raise RuntimeError("JWKS response was not a JSON object.")
-        _JWKS_CACHE = _cache_set(jwks, resolved_settings.OIDC_CACHE_TTL_SECONDS)
-        return jwks
-    except (httpx.HTTPError, ValueError) as exc:
-        raise RuntimeError(f"Failed to fetch JWKS from {jwks_uri}: {exc}") from exc
-    finally:
-        if close_client:
-            await client.aclose()
+        await task
+    except asyncio.CancelledError:
+        pass
 
 
 # PUBLIC_INTERFACE
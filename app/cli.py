@@ -6,7 +6,8 @@ This module provides a small Typer CLI that can be invoked via:
     python -m app.cli seed
 
 It uses the existing async SQLAlchemy session/engine configuration and relies on
-DATABASE_URL being set in the environment (or .env).
+DATABASE_URL being set in the environment (or .env). SQLite URLs (local demos/tests)
+are seeded through a synchronous engine instead, without starting an event loop.
 """
 
 from __future__ import annotations
@@ -14,15 +15,32 @@ from __future__ import annotations
 import asyncio
 import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Coroutine,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 import typer
-from sqlalchemy import delete, select
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import Settings, get_settings
-from app.db.session import get_sessionmaker
-from app.models.domain import Project, Task, Vulnerability
+# SQLAlchemy, settings and the ORM models dominate import time; they are imported inside the
+# functions that need them so `--help` and plain `import app.cli` stay cheap.
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy import Executable, Select
+    from sqlalchemy.orm import Session
+
+    from app.core.config import Settings
 
 app = typer.Typer(
     add_completion=False,
@@ -30,6 +48,34 @@ app = typer.Typer(
 )
 
 
+_T = TypeVar("_T")
+
+# One loop per process: repeated invocations (e.g. CliRunner) skip loop setup/teardown and
+# keep pooled connections, which are bound to the loop that opened them, usable.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run_coro(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run `coro` to completion on the CLI's cached event loop."""
+    from app.core.config import get_settings
+    from app.core.event_loop import configure_event_loop
+
+    global _LOOP  # noqa: PLW0603
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("CLI commands cannot be invoked from a running event loop.")
+
+    if _LOOP is None or _LOOP.is_closed():
+        configure_event_loop(get_settings().EVENT_LOOP)
+        _LOOP = asyncio.new_event_loop()
+    return _LOOP.run_until_complete(coro)
+
+
 @dataclass(frozen=True)
 class _SeedCounts:
     projects: int
@@ -45,225 +91,319 @@ def _require_database_url(settings: Settings) -> None:
         )
 
 
-async def _truncate_all(session: AsyncSession) -> None:
+@cache
+def _reset_statements(dialect_name: str) -> Tuple[Executable, ...]:
     """
-    Delete all rows from domain tables.
+    Build the statements that empty the domain tables, once per dialect.
 
     Notes:
-        - We delete in dependency order to satisfy FK constraints.
-        - In Postgres, TRUNCATE ... CASCADE could be used, but delete() is portable.
+        - On PostgreSQL a single TRUNCATE ... CASCADE is used: it drops the table files
+          instead of deleting row by row, so cost does not grow with existing data.
+        - Other dialects fall back to portable delete() calls in dependency order
+          to satisfy FK constraints.
     """
-    await session.execute(delete(Vulnerability))
-    await session.execute(delete(Task))
-    await session.execute(delete(Project))
+    from sqlalchemy import delete, text
+
+    from app.models.domain import Project, Task, Vulnerability
+
+    if dialect_name == "postgresql":
+        return (
+            text(
+                f"TRUNCATE {Vulnerability.__tablename__}, {Task.__tablename__}, "
+                f"{Project.__tablename__} CASCADE"
+            ),
+        )
+    return (delete(Vulnerability), delete(Task), delete(Project))
 
 
-async def _has_any_data(session: AsyncSession) -> bool:
+def _truncate_all(session: Session) -> None:
+    """Delete all rows from domain tables (see `_reset_statements`)."""
+    for stmt in _reset_statements(session.get_bind().dialect.name):
+        session.execute(stmt)
+
+
+@lru_cache(maxsize=1)
+def _any_data_stmt() -> Select[Tuple[bool]]:
+    """
+    Build the existence check once per process.
+
+    One round-trip; the database short-circuits on the first non-empty table. Reusing the
+    statement skips expression construction and hits the compiled cache.
+    """
+    from sqlalchemy import exists, or_, select
+
+    from app.models.domain import Project, Task, Vulnerability
+
+    return select(
+        or_(
+            exists(select(Project.id)),
+            exists(select(Task.id)),
+            exists(select(Vulnerability.id)),
+        )
+    )
+
+
+def _has_any_data(session: Session) -> bool:
     """Return True if there are already projects/tasks/vulnerabilities present."""
-    res = await session.execute(select(Project.id).limit(1))
-    if res.first() is not None:
-        return True
-    res = await session.execute(select(Task.id).limit(1))
-    if res.first() is not None:
-        return True
-    res = await session.execute(select(Vulnerability.id).limit(1))
-    return res.first() is not None
+    return bool(session.execute(_any_data_stmt()).scalar())
+
+
+# Demo dataset, built once at import. Plain dicts keep it easy to tweak without importing
+# Pydantic schemas; treat these as read-only.
+_SEED_PROJECTS: Tuple[Dict[str, str], ...] = (
+    {
+        "key": "acme-cloud",
+        "name": "Acme Cloud Hardening",
+        "description": "Baseline security posture review and remediation tracking for Acme's cloud stack.",
+    },
+    {
+        "key": "globex-web",
+        "name": "Globex Web App Assessment",
+        "description": "OWASP-style assessment of the customer portal and supporting APIs.",
+    },
+    {
+        "key": "initech-internal",
+        "name": "Initech Internal Red Team",
+        "description": "Internal red team exercise focused on lateral movement and detection gaps.",
+    },
+)
+
+_SEED_TASKS: Tuple[Dict[str, str], ...] = (
+    # Acme Cloud
+    {
+        "project_key": "acme-cloud",
+        "title": "Review IAM policies and roles",
+        "description": "Identify overly broad permissions and define least-privilege roles.",
+        "status": "in_progress",
+    },
+    {
+        "project_key": "acme-cloud",
+        "title": "Enable org-wide audit logging",
+        "description": "Ensure audit logs are enabled and shipped to centralized SIEM.",
+        "status": "open",
+    },
+    {
+        "project_key": "acme-cloud",
+        "title": "Rotate long-lived credentials",
+        "description": "Replace static credentials with short-lived tokens / workload identity.",
+        "status": "blocked",
+    },
+    {
+        "project_key": "acme-cloud",
+        "title": "Implement S3 bucket policy guardrails",
+        "description": "Prevent public buckets and enforce encryption at rest.",
+        "status": "done",
+    },
+    # Globex Web
+    {
+        "project_key": "globex-web",
+        "title": "Threat model login + session flows",
+        "description": "Document assumptions, attack surface, and abuse cases for auth flows.",
+        "status": "open",
+    },
+    {
+        "project_key": "globex-web",
+        "title": "Run dynamic scan against staging",
+        "description": "Baseline DAST scan with tuned rules to reduce noise.",
+        "status": "in_progress",
+    },
+    {
+        "project_key": "globex-web",
+        "title": "Verify CSP and cookie flags",
+        "description": "Ensure HttpOnly/Secure/SameSite and CSP headers are correctly set.",
+        "status": "done",
+    },
+    # Initech Internal
+    {
+        "project_key": "initech-internal",
+        "title": "Enumerate AD trust relationships",
+        "description": "Map trust boundaries and privileged groups.",
+        "status": "open",
+    },
+    {
+        "project_key": "initech-internal",
+        "title": "Test EDR detection on LSASS access",
+        "description": "Validate alerts and response for credential dumping attempts.",
+        "status": "in_review",
+    },
+    {
+        "project_key": "initech-internal",
+        "title": "Document remediation playbook",
+        "description": "Create actionable remediation steps for common red team findings.",
+        "status": "open",
+    },
+)
 
+_SEED_VULNERABILITIES: Tuple[Dict[str, str], ...] = (
+    # Globex Web
+    {
+        "project_key": "globex-web",
+        "title": "SQL Injection in search endpoint",
+        "description": "User-supplied query is concatenated into SQL without parameterization.",
+        "severity": "critical",
+        "status": "open",
+    },
+    {
+        "project_key": "globex-web",
+        "title": "Stored XSS in profile bio",
+        "description": "HTML is not sanitized before rendering in the admin dashboard.",
+        "severity": "high",
+        "status": "triaged",
+    },
+    {
+        "project_key": "globex-web",
+        "title": "Insecure password reset tokens",
+        "description": "Reset token has low entropy and is valid for too long.",
+        "severity": "high",
+        "status": "in_progress",
+    },
+    # Acme Cloud
+    {
+        "project_key": "acme-cloud",
+        "title": "Publicly accessible storage bucket",
+        "description": "Misconfigured bucket ACL allows anonymous read access.",
+        "severity": "high",
+        "status": "open",
+    },
+    {
+        "project_key": "acme-cloud",
+        "title": "Over-permissive service account",
+        "description": "Service account has editor privileges across the org.",
+        "severity": "medium",
+        "status": "triaged",
+    },
+    # Initech Internal
+    {
+        "project_key": "initech-internal",
+        "title": "Weak SMB signing configuration",
+        "description": "SMB signing not required on key servers, enabling relay attacks.",
+        "severity": "medium",
+        "status": "open",
+    },
+    {
+        "project_key": "initech-internal",
+        "title": "Excessive local admin membership",
+        "description": "Too many users/groups are local admins on endpoints.",
+        "severity": "low",
+        "status": "accepted",
+    },
+)
+
+_SEED_DATASET: Mapping[str, Sequence[Dict[str, str]]] = MappingProxyType(
+    {
+        "projects": _SEED_PROJECTS,
+        "tasks": _SEED_TASKS,
+        "vulnerabilities": _SEED_VULNERABILITIES,
+    }
+)
+
+
+def _seed_dataset() -> Mapping[str, Sequence[Dict[str, str]]]:
+    """Return the small, realistic demo dataset (a shared module-level constant)."""
+    return _SEED_DATASET
 
-def _seed_dataset() -> Dict[str, Sequence[dict]]:
+
+def _insert_seed_data(session: Session) -> _SeedCounts:
     """
-    Define a small, realistic dataset.
+    Insert demo projects, tasks, vulnerabilities.
+
+    Each table is written with one bulk INSERT (SQLAlchemy "insertmanyvalues"), bypassing the
+    ORM unit of work; project ids come back via RETURNING for the FK references.
+
+    Idempotency:
+        This function assumes the caller already decided whether to reset or skip.
 
-    We keep this as plain dicts to make it easy to tweak without importing Pydantic schemas.
+    Transactions:
+        Does not commit; the caller owns the transaction.
     """
-    projects = [
-        {
-            "key": "acme-cloud",
-            "name": "Acme Cloud Hardening",
-            "description": "Baseline security posture review and remediation tracking for Acme's cloud stack.",
-        },
-        {
-            "key": "globex-web",
-            "name": "Globex Web App Assessment",
-            "description": "OWASP-style assessment of the customer portal and supporting APIs.",
-        },
-        {
-            "key": "initech-internal",
-            "name": "Initech Internal Red Team",
-            "description": "Internal red team exercise focused on lateral movement and detection gaps.",
-        },
-    ]
+    from sqlalchemy import insert
 
-    tasks = [
-        # Acme Cloud
-        {
-            "project_key": "acme-cloud",
-            "title": "Review IAM policies and roles",
-            "description": "Identify overly broad permissions and define least-privilege roles.",
-            "status": "in_progress",
-        },
-        {
-            "project_key": "acme-cloud",
-            "title": "Enable org-wide audit logging",
-            "description": "Ensure audit logs are enabled and shipped to centralized SIEM.",
-            "status": "open",
-        },
-        {
-            "project_key": "acme-cloud",
-            "title": "Rotate long-lived credentials",
-            "description": "Replace static credentials with short-lived tokens / workload identity.",
-            "status": "blocked",
-        },
-        {
-            "project_key": "acme-cloud",
-            "title": "Implement S3 bucket policy guardrails",
-            "description": "Prevent public buckets and enforce encryption at rest.",
-            "status": "done",
-        },
-        # Globex Web
-        {
-            "project_key": "globex-web",
-            "title": "Threat model login + session flows",
-            "description": "Document assumptions, attack surface, and abuse cases for auth flows.",
-            "status": "open",
-        },
-        {
-            "project_key": "globex-web",
-            "title": "Run dynamic scan against staging",
-            "description": "Baseline DAST scan with tuned rules to reduce noise.",
-            "status": "in_progress",
-        },
-        {
-            "project_key": "globex-web",
-            "title": "Verify CSP and cookie flags",
-            "description": "Ensure HttpOnly/Secure/SameSite and CSP headers are correctly set.",
-            "status": "done",
-        },
-        # Initech Internal
-        {
-            "project_key": "initech-internal",
-            "title": "Enumerate AD trust relationships",
-            "description": "Map trust boundaries and privileged groups.",
-            "status": "open",
-        },
-        {
-            "project_key": "initech-internal",
-            "title": "Test EDR detection on LSASS access",
-            "description": "Validate alerts and response for credential dumping attempts.",
-            "status": "in_review",
-        },
+    from app.models.domain import Project, Task, Vulnerability
+
+    dataset = _seed_dataset()
+    projects = dataset["projects"]
+
+    project_ids = session.execute(
+        insert(Project).returning(Project.id, sort_by_parameter_order=True),
+        [
+            {"name": str(p["name"]), "description": str(p.get("description") or "")}
+            for p in projects
+        ],
+    ).scalars().all()
+    project_map: Dict[str, UUID] = {
+        str(p["key"]): project_id for p, project_id in zip(projects, project_ids)
+    }
+
+    task_rows = [
         {
-            "project_key": "initech-internal",
-            "title": "Document remediation playbook",
-            "description": "Create actionable remediation steps for common red team findings.",
-            "status": "open",
-        },
+            "project_id": project_map[str(t["project_key"])],
+            "title": str(t["title"]),
+            "description": str(t.get("description") or ""),
+            "status": str(t.get("status") or "open"),
+        }
+        for t in dataset["tasks"]
     ]
+    if task_rows:
+        session.execute(insert(Task), task_rows)
 
-    vulnerabilities = [
-        # Globex Web
-        {
-            "project_key": "globex-web",
-            "title": "SQL Injection in search endpoint",
-            "description": "User-supplied query is concatenated into SQL without parameterization.",
-            "severity": "critical",
-            "status": "open",
-        },
-        {
-            "project_key": "globex-web",
-            "title": "Stored XSS in profile bio",
-            "description": "HTML is not sanitized before rendering in the admin dashboard.",
-            "severity": "high",
-            "status": "triaged",
-        },
+    vuln_rows = [
         {
-            "project_key": "globex-web",
-            "title": "Insecure password reset tokens",
-            "description": "Reset token has low entropy and is valid for too long.",
-            "severity": "high",
-            "status": "in_progress",
-        },
-        # Acme Cloud
-        {
-            "project_key": "acme-cloud",
-            "title": "Publicly accessible storage bucket",
-            "description": "Misconfigured bucket ACL allows anonymous read access.",
-            "severity": "high",
-            "status": "open",
-        },
-        {
-            "project_key": "acme-cloud",
-            "title": "Over-permissive service account",
-            "description": "Service account has editor privileges across the org.",
-            "severity": "medium",
-            "status": "triaged",
-        },
-        # Initech Internal
-        {
-            "project_key": "initech-internal",
-            "title": "Weak SMB signing configuration",
-            "description": "SMB signing not required on key servers, enabling relay attacks.",
-            "severity": "medium",
-            "status": "open",
-        },
-        {
-            "project_key": "initech-internal",
-            "title": "Excessive local admin membership",
-            "description": "Too many users/groups are local admins on endpoints.",
-            "severity": "low",
-            "status": "accepted",
-        },
+            "project_id": project_map[str(v["project_key"])],
+            "title": str(v["title"]),
+            "description": str(v.get("description") or ""),
+            "severity": str(v.get("severity") or "medium"),
+            "status": str(v.get("status") or "open"),
+        }
+        for v in dataset["vulnerabilities"]
     ]
+    if vuln_rows:
+        session.execute(insert(Vulnerability), vuln_rows)
 
-    return {"projects": projects, "tasks": tasks, "vulnerabilities": vulnerabilities}
+    return _SeedCounts(projects=len(project_map), tasks=len(task_rows), vulnerabilities=len(vuln_rows))
 
 
-async def _insert_seed_data(session: AsyncSession) -> _SeedCounts:
+def _seed(session: Session, *, reset: bool) -> int:
     """
-    Insert demo projects, tasks, vulnerabilities.
+    Reset or skip, then insert the demo dataset; returns the CLI exit code.
 
-    Idempotency:
-        This function assumes the caller already decided whether to reset or skip.
+    Written against a sync Session so the async path (via `AsyncSession.run_sync`) and the
+    SQLite path share it. The caller owns the transaction.
     """
-    dataset = _seed_dataset()
+    if reset:
+        typer.echo("Reset enabled: deleting existing rows from domain tables...")
+        _truncate_all(session)
+    elif _has_any_data(session):
+        typer.echo("Seed skipped: existing data found. Use `--reset` to clear tables and reseed.")
+        return 0
+
+    counts = _insert_seed_data(session)
+    typer.echo(
+        f"Seed complete: {counts.projects} projects, {counts.tasks} tasks, "
+        f"{counts.vulnerabilities} vulnerabilities."
+    )
+    return 0
+
+
+def _seed_sqlite(database_url: str, *, reset: bool) -> int:
+    """
+    Seed a SQLite database with the stdlib sqlite3 driver: no event loop or pool warmup.
 
-    project_map: Dict[str, Project] = {}
-    for p in dataset["projects"]:
-        project = Project(name=str(p["name"]), description=str(p.get("description") or ""))
-        session.add(project)
-        project_map[str(p["key"])] = project
-
-    # Flush to get project IDs for FK references.
-    await session.flush()
-
-    tasks_added = 0
-    for t in dataset["tasks"]:
-        project = project_map[str(t["project_key"])]
-        task = Task(
-            project_id=project.id,
-            title=str(t["title"]),
-            description=str(t.get("description") or ""),
-            status=str(t.get("status") or "open"),
-        )
-        session.add(task)
-        tasks_added += 1
-
-    vulns_added = 0
-    for v in dataset["vulnerabilities"]:
-        project = project_map[str(v["project_key"])]
-        vuln = Vulnerability(
-            project_id=project.id,
-            title=str(v["title"]),
-            description=str(v.get("description") or ""),
-            severity=str(v.get("severity") or "medium"),
-            status=str(v.get("status") or "open"),
-        )
-        session.add(vuln)
-        vulns_added += 1
+    The Alembic migrations are PostgreSQL-specific, so the schema is created from the
+    models when missing.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.orm import Session
 
-    await session.commit()
+    from app.models.base import Base
 
-    return _SeedCounts(projects=len(project_map), tasks=tasks_added, vulnerabilities=vulns_added)
+    engine = create_engine(make_url(database_url).set(drivername="sqlite"))
+    try:
+        Base.metadata.create_all(engine)
+        with Session(engine) as session, session.begin():
+            return _seed(session, reset=reset)
+    finally:
+        engine.dispose()
 
 
 # PUBLIC_INTERFACE
@@ -290,34 +430,28 @@ def seed(
     Notes:
         Run migrations first:
             alembic upgrade head
+        SQLite URLs are seeded synchronously and get their schema from the models.
     """
+    from sqlalchemy.engine import make_url
+
+    from app.core.config import get_settings
+    from app.db.session import get_sessionmaker
+
     settings = get_settings()
     _require_database_url(settings)
 
-    async def _run() -> int:
-        session_factory = get_sessionmaker(settings=settings)
-        async with session_factory() as session:
-            if reset:
-                typer.echo("Reset enabled: deleting existing rows from domain tables...")
-                await _truncate_all(session)
-                await session.commit()
-            else:
-                if await _has_any_data(session):
-                    typer.echo(
-                        "Seed skipped: existing data found. "
-                        "Use `--reset` to clear tables and reseed."
-                    )
-                    return 0
-
-            counts = await _insert_seed_data(session)
-            typer.echo(
-                f"Seed complete: {counts.projects} projects, {counts.tasks} tasks, "
-                f"{counts.vulnerabilities} vulnerabilities."
-            )
-            return 0
-
     try:
-        raise SystemExit(asyncio.run(_run()))
+        if make_url(settings.DATABASE_URL).get_backend_name() == "sqlite":
+            raise SystemExit(_seed_sqlite(settings.DATABASE_URL, reset=reset))
+
+        async def _run() -> int:
+            # Process-wide factory: repeated invocations (e.g. CliRunner) reuse one engine/pool.
+            session_factory = get_sessionmaker(settings=settings)
+            # Reset + inserts run in one transaction: a single commit, and the seed is atomic.
+            async with session_factory() as session, session.begin():
+                return await session.run_sync(_seed, reset=reset)
+
+        raise SystemExit(_run_coro(_run()))
     except KeyboardInterrupt:
         raise SystemExit(130) from None
 
@@ -0,0 +1,30 @@
+"""Coarse wall-clock helpers for response metadata."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import Tuple
+
+# (unix second, ISO-8601 string) of the last formatted timestamp.
+_LAST_TIMESTAMP: Tuple[int, str] = (-1, "")
+
+
+# PUBLIC_INTERFACE
+def utc_timestamp() -> str:
+    """
+    PUBLIC_INTERFACE
+    Return the current UTC time as ISO-8601 with whole-second resolution.
+
+    The string is formatted at most once per second and reused for every call within that
+    second, so frequently scraped metadata endpoints do not build and format a datetime
+    per request.
+
+    Returns:
+        e.g. "2024-01-01T12:00:00+00:00".
+    """
+    global _LAST_TIMESTAMP  # noqa: PLW0603
+    second = int(time.time())
+    if second != _LAST_TIMESTAMP[0]:
+        _LAST_TIMESTAMP = (second, datetime.fromtimestamp(second, timezone.utc).isoformat())
+    return _LAST_TIMESTAMP[1]
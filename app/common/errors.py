@@ -86,38 +86,51 @@ def validation_problem_example() -> ProblemDetail:
     )
 
 
+# Generated once and shared by every response entry below (schema generation walks the model).
+_PROBLEM_SCHEMA: Dict[str, Any] = ProblemDetail.model_json_schema()
+
+
 def _problem_content_schema() -> Dict[str, Any]:
     """OpenAPI content schema for application/problem+json."""
     # FastAPI's OpenAPI uses `content` for media types. By specifying the model in schema,
     # Swagger/ReDoc will display the correct problem+json payload.
     return {
         "application/problem+json": {
-            "schema": ProblemDetail.model_json_schema(),
+            "schema": _PROBLEM_SCHEMA,
         }
     }
 
 
-def _problem_content_with_example(example: ProblemDetail) -> Dict[str, Any]:
+def _problem_content_with_example(example: Dict[str, Any]) -> Dict[str, Any]:
     """OpenAPI content schema for application/problem+json with a concrete example."""
     return {
         "application/problem+json": {
-            "schema": ProblemDetail.model_json_schema(),
-            "example": example.model_dump(exclude_none=True),
+            "schema": _PROBLEM_SCHEMA,
+            "example": example,
         }
     }
 
 
+def _example(**fields: Any) -> Dict[str, Any]:
+    """Validate example fields once and return the dumped problem+json payload."""
+    return ProblemDetail(**fields).model_dump(exclude_none=True)
+
+
+_BAD_REQUEST_EXAMPLE: Dict[str, Any] = problem_detail_example().model_dump(exclude_none=True)
+_VALIDATION_EXAMPLE: Dict[str, Any] = validation_problem_example().model_dump(exclude_none=True)
+
+
 # Common reusable response documentation blocks for FastAPI.
 # These are intended for `responses=...` in route decorators (documentation only).
 COMMON_ERROR_RESPONSES: Dict[int, Dict[str, Any]] = {
     400: {
         "description": "Bad Request",
-        "content": _problem_content_with_example(problem_detail_example()),
+        "content": _problem_content_with_example(_BAD_REQUEST_EXAMPLE),
     },
     401: {
         "description": "Unauthorized",
         "content": _problem_content_with_example(
-            ProblemDetail(
+            _example(
                 type="about:blank",
                 title="Unauthorized",
                 status=401,
@@ -129,7 +142,7 @@ COMMON_ERROR_RESPONSES: Dict[int, Dict[str, Any]] = {
     403: {
         "description": "Forbidden",
         "content": _problem_content_with_example(
-            ProblemDetail(
+            _example(
                 type="about:blank",
                 title="Forbidden",
                 status=403,
@@ -141,7 +154,7 @@ COMMON_ERROR_RESPONSES: Dict[int, Dict[str, Any]] = {
     404: {
         "description": "Not Found",
         "content": _problem_content_with_example(
-            ProblemDetail(
+            _example(
                 type="about:blank",
                 title="Not Found",
                 status=404,
@@ -156,7 +169,7 @@ COMMON_ERROR_RESPONSES: Dict[int, Dict[str, Any]] = {
     },
     422: {
         "description": "Validation Error",
-        "content": _problem_content_with_example(validation_problem_example()),
+        "content": _problem_content_with_example(_VALIDATION_EXAMPLE),
     },
     500: {
         "description": "Internal Server Error",
@@ -3,8 +3,8 @@
 All handlers return RFC7807 "Problem Details" payloads using the media type:
 `application/problem+json`.
 
-Attach these handlers to both the root `app` and the prefixed `api_app` so behavior
-is consistent for all endpoints.
+Attach these handlers to the `app`; the prefixed API routes live on the same app, so
+behavior is consistent for all endpoints.
 """
 
 from __future__ import annotations
@@ -12,18 +12,36 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, Optional
 
+import orjson
 from fastapi import HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.exc import DBAPIError, IntegrityError, SQLAlchemyError
-from starlette.responses import JSONResponse
 
-from app.common.errors import ProblemDetail
 from app.domain.errors import NotFoundError
 
 logger = logging.getLogger(__name__)
 
 PROBLEM_JSON_MEDIA_TYPE = "application/problem+json"
 
+# Stable RFC7807 titles for common status codes (see `_title_from_status`).
+_STATUS_TITLES: Dict[int, str] = {
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    409: "Conflict",
+    422: "Validation error",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class ProblemJSONResponse(ORJSONResponse):
+    """orjson-serialized response with the RFC7807 `application/problem+json` media type."""
+
+    media_type = PROBLEM_JSON_MEDIA_TYPE
+
 
 def _instance_from_request(request: Request) -> str:
     """Return a stable RFC7807 `instance` value based on request path."""
@@ -31,46 +49,128 @@ def _instance_from_request(request: Request) -> str:
     return request.url.path
 
 
-def _problem_response(problem: ProblemDetail, *, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
-    """Return a JSONResponse using RFC7807 media type."""
-    return JSONResponse(
-        status_code=problem.status,
-        content=problem.model_dump(exclude_none=True),
+def _problem(
+    *,
+    title: str,
+    status_code: int,
+    detail: Optional[str],
+    instance: str,
+    type_: str = "about:blank",
+    errors: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Build a problem+json payload matching `ProblemDetail`, omitting unset members.
+
+    The fields are produced by the handlers below, so the payload is built directly
+    instead of validating a `ProblemDetail` on every error (the model documents the
+    shape in OpenAPI).
+    """
+    payload: Dict[str, Any] = {"type": type_, "title": title, "status": status_code}
+    if detail is not None:
+        payload["detail"] = detail
+    payload["instance"] = instance
+    if errors is not None:
+        payload["errors"] = errors
+    return payload
+
+
+def _problem_response(
+    problem: Dict[str, Any], *, headers: Optional[Dict[str, str]] = None
+) -> ProblemJSONResponse:
+    """Return a ProblemJSONResponse using RFC7807 media type."""
+    return ProblemJSONResponse(status_code=problem["status"], content=problem, headers=headers)
+
+
+def _static_problem_prefix(*, title: str, status_code: int, detail: str) -> bytes:
+    """
+    Serialize a fixed problem payload once, up to its `instance` member.
+
+    `instance` is the last member (see `_problem`), so the response body is this prefix,
+    the JSON-encoded path and a closing brace.
+    """
+    body = orjson.dumps(
+        _problem(title=title, status_code=status_code, detail=detail, instance="")
+    )
+    return body[: body.rindex(b'"instance"')] + b'"instance":'
+
+
+def _static_problem_response(prefix: bytes, status_code: int, instance: str) -> Response:
+    """Return a problem+json response from a precomputed prefix plus the request path."""
+    return Response(
+        content=prefix + orjson.dumps(instance) + b"}",
+        status_code=status_code,
         media_type=PROBLEM_JSON_MEDIA_TYPE,
-        headers=headers,
     )
 
 
+# Fixed leading members for handlers whose `detail` comes from the exception message.
+_NOT_FOUND_SKELETON: Dict[str, Any] = {
+    "type": "about:blank",
+    "title": "Not Found",
+    "status": status.HTTP_404_NOT_FOUND,
+}
+_FORBIDDEN_SKELETON: Dict[str, Any] = {
+    "type": "about:blank",
+    "title": "Forbidden",
+    "status": status.HTTP_403_FORBIDDEN,
+}
+
+# Payloads that differ only by `instance` are pre-serialized at import.
+_CONFLICT_PREFIX = _static_problem_prefix(
+    title="Conflict",
+    status_code=status.HTTP_409_CONFLICT,
+    detail="A database constraint was violated.",
+)
+_DATABASE_ERROR_PREFIX = _static_problem_prefix(
+    title="Internal Server Error",
+    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    detail="A database error occurred.",
+)
+_UNEXPECTED_ERROR_PREFIX = _static_problem_prefix(
+    title="Internal Server Error",
+    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    detail="An unexpected error occurred.",
+)
+
+
 # PUBLIC_INTERFACE
 def register_exception_handlers(app: Any) -> None:
     """PUBLIC_INTERFACE: Register global exception handlers on the given FastAPI app."""
 
     @app.exception_handler(HTTPException)
-    async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+    async def http_exception_handler(request: Request, exc: HTTPException) -> ProblemJSONResponse:
         # FastAPI uses HTTPException.detail as any JSON-able type; we coerce to string
         # for RFC7807 `detail` to keep responses consistent.
+        status_code = int(exc.status_code)
         detail_str = None
         if exc.detail is not None:
             detail_str = str(exc.detail)
 
-        problem = ProblemDetail(
-            type="about:blank",
-            title=_title_from_status(exc.status_code),
-            status=int(exc.status_code),
+        problem = _problem(
+            type_="about:blank",
+            title=_title_from_status(status_code),
+            status_code=status_code,
             detail=detail_str,
             instance=_instance_from_request(request),
         )
-        # Preserve provided headers (e.g., WWW-Authenticate) if any.
-        headers = {str(k): str(v) for k, v in (exc.headers or {}).items()} if exc.headers else None
+        # Preserve provided headers (e.g., WWW-Authenticate) if any. They are str -> str in
+        # practice, so pass them through and only coerce when something else slipped in.
+        headers = exc.headers or None
+        if headers and not all(
+            isinstance(k, str) and isinstance(v, str) for k, v in headers.items()
+        ):
+            headers = {str(k): str(v) for k, v in headers.items()}
         return _problem_response(problem, headers=headers)
 
     @app.exception_handler(RequestValidationError)
-    async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+    async def validation_exception_handler(
+        request: Request, exc: RequestValidationError
+    ) -> ProblemJSONResponse:
         # Convert FastAPI validation errors to RFC7807 with `errors` extension member.
-        problem = ProblemDetail(
-            type="https://example.com/problems/validation-error",
+        problem = _problem(
+            type_="https://example.com/problems/validation-error",
             title="Validation error",
-            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Request validation failed.",
             instance=_instance_from_request(request),
             errors=exc.errors(),
@@ -78,90 +178,68 @@ def register_exception_handlers(app: Any) -> None:
         return _problem_response(problem)
 
     @app.exception_handler(NotFoundError)
-    async def not_found_exception_handler(request: Request, exc: NotFoundError) -> JSONResponse:
-        problem = ProblemDetail(
-            type="about:blank",
-            title="Not Found",
-            status=status.HTTP_404_NOT_FOUND,
-            detail=str(exc),
-            instance=_instance_from_request(request),
-        )
+    async def not_found_exception_handler(
+        request: Request, exc: NotFoundError
+    ) -> ProblemJSONResponse:
+        problem = {
+            **_NOT_FOUND_SKELETON,
+            "detail": str(exc),
+            "instance": _instance_from_request(request),
+        }
         return _problem_response(problem)
 
     @app.exception_handler(PermissionError)
-    async def permission_error_handler(request: Request, exc: PermissionError) -> JSONResponse:
-        problem = ProblemDetail(
-            type="about:blank",
-            title="Forbidden",
-            status=status.HTTP_403_FORBIDDEN,
-            detail=str(exc),
-            instance=_instance_from_request(request),
-        )
+    async def permission_error_handler(
+        request: Request, exc: PermissionError
+    ) -> ProblemJSONResponse:
+        problem = {
+            **_FORBIDDEN_SKELETON,
+            "detail": str(exc),
+            "instance": _instance_from_request(request),
+        }
         return _problem_response(problem)
 
     @app.exception_handler(IntegrityError)
-    async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONResponse:
+    async def integrity_error_handler(request: Request, exc: IntegrityError) -> Response:
         # Integrity errors are typically conflicts/constraint violations.
         logger.info("IntegrityError at %s: %s", request.url.path, exc, exc_info=True)
-        problem = ProblemDetail(
-            type="about:blank",
-            title="Conflict",
-            status=status.HTTP_409_CONFLICT,
-            detail="A database constraint was violated.",
-            instance=_instance_from_request(request),
+        return _static_problem_response(
+            _CONFLICT_PREFIX,
+            status.HTTP_409_CONFLICT,
+            _instance_from_request(request),
         )
-        return _problem_response(problem)
 
     @app.exception_handler(DBAPIError)
-    async def dbapi_error_handler(request: Request, exc: DBAPIError) -> JSONResponse:
+    async def dbapi_error_handler(request: Request, exc: DBAPIError) -> Response:
         # DBAPIError indicates lower-level DB failures; do not expose details.
         logger.error("DBAPIError at %s: %s", request.url.path, exc, exc_info=True)
-        problem = ProblemDetail(
-            type="about:blank",
-            title="Internal Server Error",
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="A database error occurred.",
-            instance=_instance_from_request(request),
+        return _static_problem_response(
+            _DATABASE_ERROR_PREFIX,
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            _instance_from_request(request),
         )
-        return _problem_response(problem)
 
     @app.exception_handler(SQLAlchemyError)
-    async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+    async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError) -> Response:
         # Catch remaining SQLAlchemy exceptions.
         logger.error("SQLAlchemyError at %s: %s", request.url.path, exc, exc_info=True)
-        problem = ProblemDetail(
-            type="about:blank",
-            title="Internal Server Error",
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="A database error occurred.",
-            instance=_instance_from_request(request),
+        return _static_problem_response(
+            _DATABASE_ERROR_PREFIX,
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            _instance_from_request(request),
         )
-        return _problem_response(problem)
 
     @app.exception_handler(Exception)
-    async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
         # Last-resort handler. Do not leak exception details.
         logger.error("Unhandled exception at %s: %s", request.url.path, exc, exc_info=True)
-        problem = ProblemDetail(
-            type="about:blank",
-            title="Internal Server Error",
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred.",
-            instance=_instance_from_request(request),
+        return _static_problem_response(
+            _UNEXPECTED_ERROR_PREFIX,
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            _instance_from_request(request),
         )
-        return _problem_response(problem)
 
 
 def _title_from_status(status_code: int) -> str:
     """Map common status codes to a stable RFC7807 title."""
-    titles: Dict[int, str] = {
-        400: "Bad Request",
-        401: "Unauthorized",
-        403: "Forbidden",
-        404: "Not Found",
-        409: "Conflict",
-        422: "Validation error",
-        500: "Internal Server Error",
-        503: "Service Unavailable",
-    }
-    return titles.get(int(status_code), "Error")
+    return _STATUS_TITLES.get(status_code, "Error")
@@ -2,11 +2,124 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
 
+from fastapi import HTTPException, Query, status
 
-class PaginationParams(BaseModel):
+# Keyset position: (created_at, id) of the last item on the previous page.
+Keyset = Tuple[datetime, UUID]
+
+
+@dataclass(frozen=True, slots=True)
+class PaginationParams:
     """Pagination parameters used across list endpoints."""
 
-    limit: int = Field(default=50, ge=1, le=500, description="Maximum number of items to return.")
-    offset: int = Field(default=0, ge=0, description="Number of items to skip before returning results.")
+    limit: int
+    offset: int
+    after: Optional[Keyset] = None
+
+
+# PUBLIC_INTERFACE
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """
+    PUBLIC_INTERFACE
+    Encode a keyset position as an opaque, URL-safe cursor.
+
+    Args:
+        created_at: Creation timestamp of the last item on the page.
+        item_id: Id of the last item on the page (tie-breaker).
+
+    Returns:
+        The cursor string.
+    """
+    raw = f"{created_at.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+# PUBLIC_INTERFACE
+def decode_cursor(cursor: str) -> Keyset:
+    """
+    PUBLIC_INTERFACE
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: The opaque cursor string.
+
+    Returns:
+        The (created_at, id) keyset position.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, item_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Malformed pagination cursor.") from exc
+
+
+# PUBLIC_INTERFACE
+def next_cursor(items: Sequence[Any], limit: int) -> Optional[str]:
+    """
+    PUBLIC_INTERFACE
+    Return the cursor for the page after `items`, or None when this page is the last.
+
+    Args:
+        items: The current page (ORM rows with `created_at` and `id`).
+        limit: The requested page size.
+
+    Returns:
+        The next-page cursor, or None.
+    """
+    if len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
+
+
+# PUBLIC_INTERFACE
+async def pagination_params(
+    limit: int = Query(default=50, ge=1, le=500, description="Maximum number of items to return."),
+    offset: int = Query(
+        default=0, ge=0, description="Number of items to skip. Must be 0 (or omitted) with `cursor`."
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description=(
+            "Opaque `next_cursor` from the previous page. Pages by position (constant cost "
+            "at any depth) instead of skipping `offset` rows, so it cannot be combined with a "
+            "non-zero `offset`; `total` is then null."
+        ),
+    ),
+) -> PaginationParams:
+    """
+    PUBLIC_INTERFACE
+    FastAPI dependency for `limit`/`offset`/`cursor` query parameters.
+
+    Bounds are enforced by `Query`, so no model validation runs per request; `async def`
+    so FastAPI calls it inline instead of dispatching to its threadpool.
+
+    Returns:
+        The validated PaginationParams.
+
+    Raises:
+        HTTPException: 400 if `cursor` is malformed or combined with a non-zero `offset`.
+    """
+    after: Optional[Keyset] = None
+    if cursor:
+        if offset:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="`offset` cannot be combined with `cursor`; the cursor sets the position.",
+            )
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return PaginationParams(limit=limit, offset=offset, after=after)
@@ -0,0 +1,114 @@
+"""Response helpers for endpoints that return a single validated model."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Type
+from uuid import UUID
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from app.common.errors import COMMON_ERROR_RESPONSES
+
+
+# PUBLIC_INTERFACE
+def model_response(model: BaseModel, *, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    PUBLIC_INTERFACE
+    Serialize an already-validated model straight to a JSON response.
+
+    Used with `response_model=None`: FastAPI would otherwise validate the returned model
+    against the response model a second time and serialize it again.
+
+    Args:
+        model: The validated response model instance.
+        status_code: HTTP status code of the response.
+
+    Returns:
+        A JSON Response with pydantic's JSON encoding of `model`.
+    """
+    return Response(
+        content=model.model_dump_json(), status_code=status_code, media_type="application/json"
+    )
+
+
+# Clients may cache single-item bodies but must revalidate (If-None-Match) before reuse:
+# the data is per-user (Bearer auth) and can change at any time.
+_CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+
+# PUBLIC_INTERFACE
+def resource_etag(item_id: UUID, updated_at: datetime) -> str:
+    """
+    PUBLIC_INTERFACE
+    Weak ETag for a row version, derived from its id and `updated_at` (microseconds).
+
+    Args:
+        item_id: Primary key of the row.
+        updated_at: Last-modified timestamp of the row.
+
+    Returns:
+        e.g. 'W/"<id hex>-<microseconds since epoch>"'.
+    """
+    return f'W/"{item_id.hex}-{int(updated_at.timestamp() * 1_000_000)}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of `etag` against an If-None-Match header value (RFC 9110)."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+# PUBLIC_INTERFACE
+def conditional_model_response(request: Request, item: Any, schema: Type[BaseModel]) -> Response:
+    """
+    PUBLIC_INTERFACE
+    Respond with `item` as `schema`, or 304 Not Modified if the client's copy is current.
+
+    The ETag comes from the ORM row (`id`, `updated_at`), so a matching If-None-Match skips
+    validation and serialization and sends no body.
+
+    Args:
+        request: The incoming request (for If-None-Match).
+        item: ORM object with `id` and `updated_at` attributes.
+        schema: Read model used to serialize `item`.
+
+    Returns:
+        A 304 response, or a 200 JSON response; both carry ETag and Cache-Control.
+    """
+    etag = resource_etag(item.id, item.updated_at)
+    headers = {"ETag": etag, "Cache-Control": _CONDITIONAL_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response = model_response(schema.model_validate(item))
+    response.headers.update(headers)
+    return response
+
+
+# PUBLIC_INTERFACE
+def model_responses(
+    model: Type[BaseModel], *, status_code: int = status.HTTP_200_OK
+) -> Dict[int, Dict[str, Any]]:
+    """
+    PUBLIC_INTERFACE
+    OpenAPI `responses` for a route that returns `model_response(...)`.
+
+    Documents `model` as the success body (which `response_model=None` would drop) alongside
+    COMMON_ERROR_RESPONSES.
+
+    Args:
+        model: The response model class.
+        status_code: Success status code of the route.
+
+    Returns:
+        A mapping for the route decorator's `responses=` argument.
+    """
+    return {
+        **COMMON_ERROR_RESPONSES,
+        status_code: {"model": model, "description": "Successful Response"},
+    }
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import List
+import json
+from functools import cached_property, lru_cache
+from typing import Annotated, Any, List
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -16,12 +18,15 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        # Settings are read once per process (see get_settings) and never mutated.
+        frozen=True,
     )
 
     APP_NAME: str = Field(default="rest-api-modernized", description="Human-friendly service name.")
     APP_VERSION: str = Field(default="0.1.0", description="Service version string.")
     API_PREFIX: str = Field(default="/api", description="Base path prefix for API routes.")
-    BACKEND_CORS_ORIGINS: List[str] = Field(
+    # NoDecode: parsed by `_parse_cors_origins` below, not by pydantic-settings' JSON decoding.
+    BACKEND_CORS_ORIGINS: Annotated[List[str], NoDecode] = Field(
         default_factory=list,
         description=(
             "Allowed CORS origins for the backend. "
@@ -29,6 +34,13 @@ class Settings(BaseSettings):
         ),
     )
     LOG_LEVEL: str = Field(default="INFO", description="Python logging level (e.g., INFO, DEBUG).")
+    OPENAPI_ENABLED: bool = Field(
+        default=True,
+        description=(
+            "Serve /openapi.json, /docs and /redoc. Disable in production deployments that do "
+            "not need interactive docs; the schema is then never built."
+        ),
+    )
 
     PORT: int = Field(
         default=3002,
@@ -37,11 +49,57 @@ class Settings(BaseSettings):
         description="Port for the HTTP server (typically used by container/runtime).",
     )
 
+    EVENT_LOOP: str = Field(
+        default="auto",
+        description=(
+            "asyncio event loop implementation when started via `python -m app.main`: "
+            "auto | uvloop | uringcore | default."
+        ),
+    )
+
     # Database
     DATABASE_URL: str = Field(
         default="",
         description="Database connection URL (configure in environment).",
     )
+    DB_DISABLE_JIT: bool = Field(
+        default=True,
+        description=(
+            "Send `jit=off` to PostgreSQL on asyncpg connections so its type-introspection "
+            "queries are not JIT-compiled on connection setup (PostgreSQL 11+)."
+        ),
+    )
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        default=500,
+        ge=0,
+        description=(
+            "Prepared statements kept per asyncpg connection (LRU), so repeated queries skip "
+            "PostgreSQL's parse/plan step. Sized above the number of distinct statements the "
+            "API issues; 0 disables (e.g. behind PgBouncer in transaction mode)."
+        ),
+    )
+    DB_POOL_SIZE: int = Field(
+        default=10,
+        ge=1,
+        description="Connections kept open in the async engine's pool.",
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=20,
+        ge=0,
+        description="Extra connections allowed beyond DB_POOL_SIZE under burst load.",
+    )
+    DB_POOL_RECYCLE_SECONDS: int = Field(
+        default=1800,
+        ge=-1,
+        description="Replace pooled connections older than this (seconds; -1 disables).",
+    )
+    DB_POOL_PRE_PING: bool = Field(
+        default=False,
+        description=(
+            "Ping connections on checkout (one extra round-trip per checkout). Enable only "
+            "where idle connections are silently dropped (e.g. aggressive NAT/firewalls)."
+        ),
+    )
 
     # OIDC / Keycloak-compatible JWT validation
     OIDC_ISSUER_URL: str = Field(
@@ -82,14 +140,44 @@ class Settings(BaseSettings):
         description="DEPRECATED (use OIDC_AUDIENCE).",
     )
 
+    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @classmethod
+    def _parse_cors_origins(cls, value: Any) -> Any:
+        """Accept a JSON array or a comma-separated string."""
+        if not isinstance(value, str):
+            return value
+        raw = value.strip()
+        if not raw:
+            return []
+        if raw.startswith("["):
+            return json.loads(raw)
+        return [origin.strip() for origin in raw.split(",")]
+
+    # Normalized auth values, computed once per Settings instance (read on every request).
+    @cached_property
+    def oidc_issuer(self) -> str:
+        """Issuer URL without trailing slash, falling back to deprecated KEYCLOAK_ISSUER_URL."""
+        issuer = (self.OIDC_ISSUER_URL or "").strip() or (self.KEYCLOAK_ISSUER_URL or "").strip()
+        return issuer.rstrip("/")
+
+    @cached_property
+    def oidc_audience(self) -> str:
+        """Expected token audience, falling back to deprecated KEYCLOAK_AUDIENCE."""
+        return (self.OIDC_AUDIENCE or "").strip() or (self.KEYCLOAK_AUDIENCE or "").strip()
+
+    @cached_property
+    def oidc_client_id(self) -> str:
+        """Client id used for resource_access role extraction."""
+        return (self.OIDC_CLIENT_ID or "").strip()
+
 
 # PUBLIC_INTERFACE
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Return a cached Settings instance (simple singleton for app lifetime)."""
-    # Import-time singleton: good enough for this stage; can be replaced with lru_cache if desired.
-    global _SETTINGS  # noqa: PLW0603
-    try:
-        return _SETTINGS
-    except NameError:
-        _SETTINGS = Settings()  # type: ignore[misc]
-        return _SETTINGS
+    """
+    Return a cached Settings instance (singleton for app lifetime).
+
+    The environment/.env is read once per process; call `get_settings.cache_clear()` to
+    force a reload (e.g. in tests that change environment variables).
+    """
+    return Settings()  # type: ignore[call-arg]
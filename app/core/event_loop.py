@@ -0,0 +1,60 @@
+"""asyncio event loop policy selection (uvloop / io_uring-backed loops)."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Preference order for EVENT_LOOP=auto.
+_AUTO_ORDER = ("uvloop",)
+_SUPPORTED = ("auto", "uvloop", "uringcore", "default")
+
+
+def _install_policy(module_name: str) -> bool:
+    """Install `<module>.EventLoopPolicy()` if the module is importable."""
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(module.EventLoopPolicy())
+    return True
+
+
+# PUBLIC_INTERFACE
+def configure_event_loop(name: str) -> str:
+    """
+    PUBLIC_INTERFACE
+    Install the asyncio event loop policy selected by `EVENT_LOOP`.
+
+    Supported values:
+        - auto: uvloop if installed, otherwise the default asyncio loop
+        - uvloop: uvloop (falls back to default if not installed)
+        - uringcore: io_uring-backed loop (Linux >= 5.11; falls back to default)
+        - default: the standard asyncio loop
+
+    Must be called before the server creates its event loop.
+
+    Args:
+        name: The requested loop implementation.
+
+    Returns:
+        The name of the loop implementation actually installed.
+    """
+    choice = (name or "auto").strip().lower()
+    if choice not in _SUPPORTED:
+        logger.warning("Unknown EVENT_LOOP=%r; using the default asyncio loop.", name)
+        return "default"
+    if choice == "default":
+        return "default"
+
+    candidates = _AUTO_ORDER if choice == "auto" else (choice,)
+    for candidate in candidates:
+        if _install_policy(candidate):
+            return candidate
+
+    if choice != "auto":
+        logger.warning("EVENT_LOOP=%s requested but not available; using default asyncio loop.", choice)
+    return "default"
@@ -2,21 +2,10 @@
 
 from __future__ import annotations
 
-from typing import AsyncIterator
-
-from sqlalchemy.ext.asyncio import AsyncSession
-
 from app.db.session import get_async_session
 
-
 # PUBLIC_INTERFACE
-async def get_db_session() -> AsyncIterator[AsyncSession]:
-    """
-    PUBLIC_INTERFACE
-    FastAPI dependency that yields an AsyncSession.
-
-    Returns:
-        An async generator yielding an AsyncSession.
-    """
-    async for session in get_async_session():
-        yield session
+# FastAPI dependency that yields an AsyncSession (closed after the request finishes).
+# An alias rather than a wrapper generator: FastAPI drives the session generator directly,
+# and exceptions raised in the endpoint reach its `async with` block.
+get_db_session = get_async_session
@@ -0,0 +1,40 @@
+"""Service dependency providers for FastAPI.
+
+Providers are `async def` so FastAPI calls them inline instead of dispatching to its threadpool.
+
+The session dependency is function-scoped: FastAPI closes it (committing the request's
+transaction) when the endpoint returns, before the response is sent, so a 2xx is only
+returned for committed writes and a follow-up request on another connection sees them.
+"""
+
+from __future__ import annotations
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.db import get_db_session
+from app.domain.services import ProjectService, TaskService, VulnerabilityService
+
+
+# PUBLIC_INTERFACE
+async def get_project_service(
+    session: AsyncSession = Depends(get_db_session, scope="function"),
+) -> ProjectService:
+    """PUBLIC_INTERFACE: Return the request-scoped ProjectService bound to the request session."""
+    return ProjectService(session)
+
+
+# PUBLIC_INTERFACE
+async def get_task_service(
+    session: AsyncSession = Depends(get_db_session, scope="function"),
+) -> TaskService:
+    """PUBLIC_INTERFACE: Return the request-scoped TaskService bound to the request session."""
+    return TaskService(session)
+
+
+# PUBLIC_INTERFACE
+async def get_vulnerability_service(
+    session: AsyncSession = Depends(get_db_session, scope="function"),
+) -> VulnerabilityService:
+    """PUBLIC_INTERFACE: Return the request-scoped VulnerabilityService for the request session."""
+    return VulnerabilityService(session)
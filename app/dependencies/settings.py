@@ -0,0 +1,21 @@
+"""Settings dependency provider for FastAPI."""
+
+from __future__ import annotations
+
+from app.core.config import Settings, get_settings
+
+
+# PUBLIC_INTERFACE
+async def get_app_settings() -> Settings:
+    """
+    PUBLIC_INTERFACE
+    Return the process-wide Settings for injection with `Depends`.
+
+    `get_settings` is a plain (sync) function, and FastAPI runs sync dependencies in its
+    threadpool; this coroutine wrapper is awaited inline instead, so auth-protected and info
+    endpoints do not pay a thread hop per request just to read a cached object.
+
+    Returns:
+        The cached Settings instance.
+    """
+    return get_settings()
@@ -2,14 +2,145 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import re
+from functools import cache
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Union
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, bindparam, exists, func, insert, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.pagination import Keyset
+from app.models.base import uuid7
 from app.models.domain import Project, Task, Vulnerability
 
+_M = TypeVar("_M", bound=Union[Project, Task, Vulnerability])
+
+# LIKE metacharacters in user search terms, escaped with backslash (PostgreSQL's default
+# LIKE escape, so the SQL stays a plain `ILIKE :q` that the trigram indexes serve).
+_LIKE_SPECIAL = re.compile(r"[\\%_]")
+
+
+def _contains_pattern(term: str) -> str:
+    """ILIKE pattern matching `term` literally anywhere in the value."""
+    escaped = _LIKE_SPECIAL.sub(r"\\\g<0>", term.strip())
+    return f"%{escaped}%"
+
+
+@cache
+def _filtered_stmt(
+    model: Type[_M], eq_filters: Tuple[str, ...], search_column: Optional[str]
+) -> Select[Tuple[_M]]:
+    """`SELECT model WHERE <col> = :<col> ... [AND <search_column> ILIKE :q]`."""
+    stmt = select(model)
+    for name in eq_filters:
+        stmt = stmt.where(getattr(model, name) == bindparam(name))
+    if search_column is not None:
+        stmt = stmt.where(getattr(model, search_column).ilike(bindparam("q")))
+    return stmt
+
+
+@cache
+def _page_stmt(
+    model: Type[_M], eq_filters: Tuple[str, ...], search_column: Optional[str], keyset: bool
+) -> Select[Tuple[_M]]:
+    """
+    Build the page query for one filter shape, once per process.
+
+    Newest first, `LIMIT :limit OFFSET :offset`; with `keyset` the page starts right after
+    (:after_created_at, :after_id) instead. No total is computed here, so the planner can
+    walk the `created_at DESC` list indexes and stop at LIMIT rather than reading (and
+    counting) every match. All values are bound parameters, so every call with the same
+    shape reuses this statement and its compiled SQL instead of rebuilding the expression
+    tree.
+    """
+    stmt = _filtered_stmt(model, eq_filters, search_column)
+    if keyset:
+        stmt = stmt.where(
+            tuple_(model.created_at, model.id)
+            < tuple_(
+                bindparam("after_created_at", type_=model.created_at.type),
+                bindparam("after_id", type_=model.id.type),
+            )
+        )
+    return (
+        stmt.order_by(model.created_at.desc(), model.id.desc())
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+
+
+@cache
+def _count_stmt(
+    model: Type[_M], eq_filters: Tuple[str, ...], search_column: Optional[str]
+) -> Select[Tuple[int]]:
+    """`SELECT count(*)` over one filter shape, built once per process."""
+    filtered = _filtered_stmt(model, eq_filters, search_column)
+    return select(func.count()).select_from(filtered.subquery())
+
+
+async def _paginate(
+    session: AsyncSession,
+    model: Type[_M],
+    *,
+    filters: Dict[str, Any],
+    search_column: str,
+    q: Optional[str],
+    limit: int,
+    offset: int,
+    after: Optional[Keyset] = None,
+) -> tuple[list[_M], Optional[int]]:
+    """
+    Return one page of `model` rows (newest first) and the total match count.
+
+    `filters` maps column names to required values (equality); `q` is matched
+    case-insensitively as a substring of `search_column`. The total is only counted when
+    the page cannot tell it: a partial page (or an empty first page) ends the result, so
+    the total is `offset + len(page)` and the page query is the only round-trip. Keyset
+    pages (`after`) return no total (None): counting every match on each page would cost
+    what the cursor exists to avoid.
+    """
+    eq_filters = tuple(sorted(filters))
+    search = search_column if q else None
+    params: Dict[str, Any] = {**filters, "limit": limit, "offset": offset}
+    if q:
+        params["q"] = _contains_pattern(q)
+    if after is not None:
+        params["after_created_at"], params["after_id"] = after
+
+    page_stmt = _page_stmt(model, eq_filters, search, after is not None)
+    items = list((await session.scalars(page_stmt, params)).all())
+    if after is not None:
+        return items, None
+    if len(items) < limit and (items or offset == 0):
+        return items, offset + len(items)
+
+    count_params = {k: v for k, v in params.items() if k in filters or k == "q"}
+    total = await session.execute(_count_stmt(model, eq_filters, search), count_params)
+    return items, int(total.scalar_one())
+
+
+_C = TypeVar("_C", Task, Vulnerability)
+
+
+async def _insert_into_project(
+    session: AsyncSession, model: Type[_C], values: Dict[str, Any]
+) -> Optional[_C]:
+    """
+    Insert a project child row only if its project exists, in one round-trip.
+
+    Emits `INSERT ... SELECT <values> WHERE EXISTS (project) RETURNING *` and returns the new
+    object, or None when the project does not exist. Python-side column defaults do not
+    apply to INSERT ... SELECT, so the primary key is generated here.
+    """
+    values = {"id": uuid7(), **values}
+    columns = model.__table__.c
+    source = select(*(literal(v, columns[k].type) for k, v in values.items())).where(
+        exists().where(Project.id == values["project_id"])
+    )
+    stmt = insert(model).from_select(list(values), source).returning(model)
+    return (await session.scalars(stmt)).one_or_none()
+
 
 class ProjectRepository:
     """DB operations for projects."""
@@ -23,9 +154,8 @@ class ProjectRepository:
         return project
 
     async def get(self, project_id: UUID) -> Optional[Project]:
-        stmt = select(Project).where(Project.id == project_id)
-        res = await self._session.execute(stmt)
-        return res.scalar_one_or_none()
+        # Identity-map hit (no query) when already loaded in this session; PK lookup otherwise.
+        return await self._session.get(Project, project_id)
 
     async def delete(self, project: Project) -> None:
         await self._session.delete(project)
@@ -36,23 +166,18 @@ class ProjectRepository:
         limit: int,
         offset: int,
         q: Optional[str] = None,
-    ) -> tuple[list[Project], int]:
-        filters = []
-        if q:
-            like = f"%{q.strip()}%"
-            filters.append(Project.name.ilike(like))
-
-        base = select(Project)
-        if filters:
-            for f in filters:
-                base = base.where(f)
-
-        total_stmt = select(func.count()).select_from(base.subquery())
-        total = int((await self._session.execute(total_stmt)).scalar_one())
-
-        stmt = base.order_by(Project.created_at.desc()).limit(limit).offset(offset)
-        items = list((await self._session.execute(stmt)).scalars().all())
-        return items, total
+        after: Optional[Keyset] = None,
+    ) -> tuple[list[Project], Optional[int]]:
+        return await _paginate(
+            self._session,
+            Project,
+            filters={},
+            search_column="name",
+            q=q,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
 
 
 class TaskRepository:
@@ -61,15 +186,23 @@ class TaskRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def create(self, *, task: Task) -> Task:
-        self._session.add(task)
-        await self._session.flush()
-        return task
+    async def create_in_project(
+        self, *, project_id: UUID, title: str, description: Optional[str], status: str
+    ) -> Optional[Task]:
+        """Insert a task if `project_id` exists; returns None otherwise."""
+        return await _insert_into_project(
+            self._session,
+            Task,
+            {
+                "project_id": project_id,
+                "title": title,
+                "description": description,
+                "status": status,
+            },
+        )
 
     async def get(self, task_id: UUID) -> Optional[Task]:
-        stmt = select(Task).where(Task.id == task_id)
-        res = await self._session.execute(stmt)
-        return res.scalar_one_or_none()
+        return await self._session.get(Task, task_id)
 
     async def delete(self, task: Task) -> None:
         await self._session.delete(task)
@@ -82,23 +215,24 @@ class TaskRepository:
         project_id: Optional[UUID] = None,
         status: Optional[str] = None,
         q: Optional[str] = None,
-    ) -> tuple[list[Task], int]:
-        stmt = select(Task)
-
+        after: Optional[Keyset] = None,
+    ) -> tuple[list[Task], Optional[int]]:
+        filters: Dict[str, Any] = {}
         if project_id:
-            stmt = stmt.where(Task.project_id == project_id)
+            filters["project_id"] = project_id
         if status:
-            stmt = stmt.where(Task.status == status)
-        if q:
-            like = f"%{q.strip()}%"
-            stmt = stmt.where(Task.title.ilike(like))
-
-        total_stmt = select(func.count()).select_from(stmt.subquery())
-        total = int((await self._session.execute(total_stmt)).scalar_one())
+            filters["status"] = status
 
-        items_stmt = stmt.order_by(Task.created_at.desc()).limit(limit).offset(offset)
-        items = list((await self._session.execute(items_stmt)).scalars().all())
-        return items, total
+        return await _paginate(
+            self._session,
+            Task,
+            filters=filters,
+            search_column="title",
+            q=q,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
 
 
 class VulnerabilityRepository:
@@ -107,15 +241,30 @@ class VulnerabilityRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def create(self, *, vulnerability: Vulnerability) -> Vulnerability:
-        self._session.add(vulnerability)
-        await self._session.flush()
-        return vulnerability
+    async def create_in_project(
+        self,
+        *,
+        project_id: UUID,
+        title: str,
+        description: Optional[str],
+        severity: str,
+        status: str,
+    ) -> Optional[Vulnerability]:
+        """Insert a vulnerability if `project_id` exists; returns None otherwise."""
+        return await _insert_into_project(
+            self._session,
+            Vulnerability,
+            {
+                "project_id": project_id,
+                "title": title,
+                "description": description,
+                "severity": severity,
+                "status": status,
+            },
+        )
 
     async def get(self, vulnerability_id: UUID) -> Optional[Vulnerability]:
-        stmt = select(Vulnerability).where(Vulnerability.id == vulnerability_id)
-        res = await self._session.execute(stmt)
-        return res.scalar_one_or_none()
+        return await self._session.get(Vulnerability, vulnerability_id)
 
     async def delete(self, vulnerability: Vulnerability) -> None:
         await self._session.delete(vulnerability)
@@ -129,22 +278,23 @@ class VulnerabilityRepository:
         severity: Optional[str] = None,
         status: Optional[str] = None,
         q: Optional[str] = None,
-    ) -> tuple[list[Vulnerability], int]:
-        stmt = select(Vulnerability)
-
+        after: Optional[Keyset] = None,
+    ) -> tuple[list[Vulnerability], Optional[int]]:
+        filters: Dict[str, Any] = {}
         if project_id:
-            stmt = stmt.where(Vulnerability.project_id == project_id)
+            filters["project_id"] = project_id
         if severity:
-            stmt = stmt.where(Vulnerability.severity == severity)
+            filters["severity"] = severity
         if status:
-            stmt = stmt.where(Vulnerability.status == status)
-        if q:
-            like = f"%{q.strip()}%"
-            stmt = stmt.where(Vulnerability.title.ilike(like))
-
-        total_stmt = select(func.count()).select_from(stmt.subquery())
-        total = int((await self._session.execute(total_stmt)).scalar_one())
-
-        items_stmt = stmt.order_by(Vulnerability.created_at.desc()).limit(limit).offset(offset)
-        items = list((await self._session.execute(items_stmt)).scalars().all())
-        return items, total
+            filters["status"] = status
+
+        return await _paginate(
+            self._session,
+            Vulnerability,
+            filters=filters,
+            search_column="title",
+            q=q,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Generic, List, Optional, TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 T = TypeVar("T")
 
@@ -15,9 +15,20 @@ class ListResponse(BaseModel, Generic[T]):
     """A simple list envelope with pagination metadata."""
 
     items: List[T] = Field(..., description="Page of items.")
-    total: int = Field(..., ge=0, description="Total number of items matching the filter.")
+    total: Optional[int] = Field(
+        ...,
+        ge=0,
+        description=(
+            "Total number of items matching the filter; null on `cursor` pages (a total "
+            "would mean counting every match on each page)."
+        ),
+    )
     limit: int = Field(..., ge=1, le=500, description="Requested page size.")
     offset: int = Field(..., ge=0, description="Requested page offset.")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page (pass as `cursor`); null on the last page.",
+    )
 
 
 class ProjectBase(BaseModel):
@@ -41,8 +52,7 @@ class ProjectRead(ProjectBase):
     created_at: datetime = Field(..., description="Creation timestamp (UTC).")
     updated_at: datetime = Field(..., description="Last update timestamp (UTC).")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TaskBase(BaseModel):
@@ -69,8 +79,7 @@ class TaskRead(TaskBase):
     created_at: datetime = Field(..., description="Creation timestamp (UTC).")
     updated_at: datetime = Field(..., description="Last update timestamp (UTC).")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class VulnerabilityBase(BaseModel):
@@ -104,5 +113,12 @@ class VulnerabilityRead(VulnerabilityBase):
     created_at: datetime = Field(..., description="Creation timestamp (UTC).")
     updated_at: datetime = Field(..., description="Last update timestamp (UTC).")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# Bulk validators for list endpoints: one call validates a whole page of ORM rows.
+ProjectReadListAdapter: TypeAdapter[List[ProjectRead]] = TypeAdapter(List[ProjectRead])
+TaskReadListAdapter: TypeAdapter[List[TaskRead]] = TypeAdapter(List[TaskRead])
+VulnerabilityReadListAdapter: TypeAdapter[List[VulnerabilityRead]] = TypeAdapter(
+    List[VulnerabilityRead]
+)
@@ -1,21 +1,30 @@
-"""Service layer for core domain resources (business logic + authorization)."""
+"""Service layer for core domain resources (business logic + authorization).
+
+Services never commit: the request's session runs in one transaction that
+`get_async_session` commits when the endpoint returns, before the response is sent.
+Writes are flushed inside the service so database errors surface while the request is
+still being handled and server-generated values (RETURNING) are loaded before the
+response is built.
+"""
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import AuthenticatedUser
+from app.common.pagination import Keyset
 from app.domain.errors import NotFoundError
 from app.domain.repositories import ProjectRepository, TaskRepository, VulnerabilityRepository
 from app.models.domain import Project, Task, Vulnerability
 
 
 def _is_admin(user: AuthenticatedUser) -> bool:
-    """Best-effort check for admin-like roles (realm or client roles)."""
-    return bool({"admin", "realm-admin"}.intersection(set(user.roles)))
+    """Best-effort check for admin-like roles (realm or client roles); see ADMIN_ROLES."""
+    return user.is_admin
 
 
 class ProjectService:
@@ -23,7 +32,10 @@ class ProjectService:
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
-        self._repo = ProjectRepository(session)
+
+    @cached_property
+    def _repo(self) -> ProjectRepository:
+        return ProjectRepository(self._session)
 
     async def create(self, *, user: AuthenticatedUser, name: str, description: Optional[str]) -> Project:
         # RBAC: creating projects is admin-only by default.
@@ -32,8 +44,6 @@ class ProjectService:
             raise PermissionError("Not authorized to create projects.")
         project = Project(name=name, description=description)
         await self._repo.create(project=project)
-        await self._session.commit()
-        await self._session.refresh(project)
         return project
 
     async def get(self, *, project_id: UUID) -> Project:
@@ -57,8 +67,7 @@ class ProjectService:
             project.name = name
         if description is not None:
             project.description = description
-        await self._session.commit()
-        await self._session.refresh(project)
+        await self._session.flush()
         return project
 
     async def delete(self, *, user: AuthenticatedUser, project_id: UUID) -> None:
@@ -66,10 +75,12 @@ class ProjectService:
             raise PermissionError("Not authorized to delete projects.")
         project = await self.get(project_id=project_id)
         await self._repo.delete(project)
-        await self._session.commit()
+        await self._session.flush()
 
-    async def list(self, *, limit: int, offset: int, q: Optional[str]) -> tuple[list[Project], int]:
-        return await self._repo.list(limit=limit, offset=offset, q=q)
+    async def list(
+        self, *, limit: int, offset: int, q: Optional[str], after: Optional[Keyset] = None
+    ) -> tuple[list[Project], Optional[int]]:
+        return await self._repo.list(limit=limit, offset=offset, q=q, after=after)
 
 
 class TaskService:
@@ -77,8 +88,10 @@ class TaskService:
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
-        self._repo = TaskRepository(session)
-        self._projects = ProjectRepository(session)
+
+    @cached_property
+    def _repo(self) -> TaskRepository:
+        return TaskRepository(self._session)
 
     async def create(
         self,
@@ -90,13 +103,12 @@ class TaskService:
         status: str,
     ) -> Task:
         # RBAC: any authenticated user can create tasks (adjust as needed).
-        project = await self._projects.get(project_id)
-        if project is None:
+        # The project existence check rides on the INSERT itself (no separate lookup).
+        task = await self._repo.create_in_project(
+            project_id=project_id, title=title, description=description, status=status
+        )
+        if task is None:
             raise NotFoundError("Project not found.")
-        task = Task(project_id=project_id, title=title, description=description, status=status)
-        await self._repo.create(task=task)
-        await self._session.commit()
-        await self._session.refresh(task)
         return task
 
     async def get(self, *, task_id: UUID) -> Task:
@@ -121,8 +133,7 @@ class TaskService:
             task.description = description
         if status is not None:
             task.status = status
-        await self._session.commit()
-        await self._session.refresh(task)
+        await self._session.flush()
         return task
 
     async def delete(self, *, user: AuthenticatedUser, task_id: UUID) -> None:
@@ -131,7 +142,7 @@ class TaskService:
             raise PermissionError("Not authorized to delete tasks.")
         task = await self.get(task_id=task_id)
         await self._repo.delete(task)
-        await self._session.commit()
+        await self._session.flush()
 
     async def list(
         self,
@@ -141,8 +152,16 @@ class TaskService:
         project_id: Optional[UUID],
         status: Optional[str],
         q: Optional[str],
-    ) -> tuple[list[Task], int]:
-        return await self._repo.list(limit=limit, offset=offset, project_id=project_id, status=status, q=q)
+        after: Optional[Keyset] = None,
+    ) -> tuple[list[Task], Optional[int]]:
+        return await self._repo.list(
+            limit=limit,
+            offset=offset,
+            project_id=project_id,
+            status=status,
+            q=q,
+            after=after,
+        )
 
 
 class VulnerabilityService:
@@ -150,8 +169,10 @@ class VulnerabilityService:
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
-        self._repo = VulnerabilityRepository(session)
-        self._projects = ProjectRepository(session)
+
+    @cached_property
+    def _repo(self) -> VulnerabilityRepository:
+        return VulnerabilityRepository(self._session)
 
     async def create(
         self,
@@ -164,19 +185,16 @@ class VulnerabilityService:
         status: str,
     ) -> Vulnerability:
         # RBAC: any authenticated user can create vulnerabilities (adjust as needed).
-        project = await self._projects.get(project_id)
-        if project is None:
-            raise NotFoundError("Project not found.")
-        vuln = Vulnerability(
+        # The project existence check rides on the INSERT itself (no separate lookup).
+        vuln = await self._repo.create_in_project(
             project_id=project_id,
             title=title,
             description=description,
             severity=severity,
             status=status,
         )
-        await self._repo.create(vulnerability=vuln)
-        await self._session.commit()
-        await self._session.refresh(vuln)
+        if vuln is None:
+            raise NotFoundError("Project not found.")
         return vuln
 
     async def get(self, *, vulnerability_id: UUID) -> Vulnerability:
@@ -204,8 +222,7 @@ class VulnerabilityService:
             vuln.severity = severity
         if status is not None:
             vuln.status = status
-        await self._session.commit()
-        await self._session.refresh(vuln)
+        await self._session.flush()
         return vuln
 
     async def delete(self, *, user: AuthenticatedUser, vulnerability_id: UUID) -> None:
@@ -214,7 +231,7 @@ class VulnerabilityService:
             raise PermissionError("Not authorized to delete vulnerabilities.")
         vuln = await self.get(vulnerability_id=vulnerability_id)
         await self._repo.delete(vuln)
-        await self._session.commit()
+        await self._session.flush()
 
     async def list(
         self,
@@ -225,7 +242,8 @@ class VulnerabilityService:
         severity: Optional[str],
         status: Optional[str],
         q: Optional[str],
-    ) -> tuple[list[Vulnerability], int]:
+        after: Optional[Keyset] = None,
+    ) -> tuple[list[Vulnerability], Optional[int]]:
         return await self._repo.list(
             limit=limit,
             offset=offset,
@@ -233,4 +251,5 @@ class VulnerabilityService:
             severity=severity,
             status=status,
             q=q,
+            after=after,
         )
@@ -11,16 +11,25 @@ Routes:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional
 
-from fastapi import FastAPI
+import orjson
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse, Response
+from starlette.routing import Route
 
 from app.api.routes import router as api_routes_router
+from app.auth.oidc import close_http_client, start_jwks_refresher, stop_jwks_refresher
 from app.common.exception_handlers import register_exception_handlers
 from app.core.config import get_settings
+from app.core.event_loop import configure_event_loop
 from app.core.logging import configure_logging
+from app.db.session import dispose_engine, warm_pool
 from app.middleware.correlation import CorrelationIdMiddleware
 from app.openapi.metadata import OPENAPI_TAGS
 from app.routers.health import router as health_router
@@ -30,10 +39,37 @@ from app.routers.protected import router as protected_router
 from app.routers.tasks import router as tasks_router
 from app.routers.vulnerabilities import router as vulnerabilities_router
 
+logger = logging.getLogger(__name__)
 
-def _parse_cors_origins(origins: List[str]) -> List[str]:
-    """Normalize CORS origins list (already parsed by Settings) and remove empties."""
-    return [o.strip() for o in origins if isinstance(o, str) and o.strip()]
+
+# Explicit CORS allow-lists: CORSMiddleware joins them into its preflight headers once at
+# startup, instead of echoing each request's Access-Control-Request-Headers back.
+_CORS_ALLOW_METHODS = ("GET", "POST", "PATCH", "DELETE", "OPTIONS")
+_CORS_ALLOW_HEADERS = ("Authorization", "Content-Type", "If-None-Match", "X-Request-Id")
+
+
+def _parse_cors_origins(origins: List[str]) -> FrozenSet[str]:
+    """
+    Normalize CORS origins (already parsed by Settings), dropping empties and duplicates.
+
+    A frozenset makes the per-request origin check in CORSMiddleware a hash lookup rather
+    than a scan of the list.
+    """
+    return frozenset(o.strip() for o in origins if isinstance(o, str) and o.strip())
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Application lifespan: warm the DB pool and JWKS; release shared clients on shutdown."""
+    start_jwks_refresher()
+    try:
+        await warm_pool()
+    except Exception as exc:  # noqa: BLE001 - a cold pool must not block startup
+        logger.warning("Database pool warm-up failed: %s", exc)
+    yield
+    await stop_jwks_refresher()
+    await close_http_client()
+    await dispose_engine()
 
 
 settings = get_settings()
@@ -44,6 +80,10 @@ app = FastAPI(
     description="Modernized REST API backend (FastAPI) for the security operations platform.",
     version=settings.APP_VERSION,
     openapi_tags=OPENAPI_TAGS,
+    lifespan=_lifespan,
+    default_response_class=ORJSONResponse,
+    # None also disables /docs and /redoc; `_custom_openapi` then never runs.
+    openapi_url="/openapi.json" if settings.OPENAPI_ENABLED else None,
 )
 
 # Centralized error handling (RFC7807 problem+json)
@@ -60,11 +100,38 @@ if cors_origins:
         CORSMiddleware,
         allow_origins=cors_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-        expose_headers=["X-Request-Id"],
+        allow_methods=_CORS_ALLOW_METHODS,
+        allow_headers=_CORS_ALLOW_HEADERS,
+        expose_headers=["X-Request-Id", "ETag"],
     )
 
+# Compress larger JSON bodies (list pages); small ones such as /health and / stay as-is.
+# Added last, so it is the outermost layer and compresses the final body.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Static bodies for the fixed-content endpoints, serialized once at import. Handlers wrap
+# them in a fresh Response (middleware mutates response headers in place), skipping
+# response-model validation and JSON encoding on every call.
+_SERVICE_ROOT_BODY = orjson.dumps({"name": settings.APP_NAME, "version": settings.APP_VERSION})
+_ERROR_FORMAT_BODY = orjson.dumps(
+    {
+        "media_type": "application/problem+json",
+        "fields": ["type", "title", "status", "detail", "instance", "errors?"],
+        "notes": [
+            "`errors` is included for validation failures (422) and contains "
+            "FastAPI/Pydantic error objects.",
+            "`instance` is set to the request path.",
+        ],
+        "example": {
+            "type": "about:blank",
+            "title": "Not Found",
+            "status": 404,
+            "detail": "Resource not found.",
+            "instance": "/api/projects/00000000-0000-0000-0000-000000000000",
+        },
+    }
+)
+
 # Root endpoint (not under /api) for convenience
 @app.get(
     "/",
@@ -72,8 +139,9 @@ if cors_origins:
     description="Returns service name and version.",
     tags=["Root"],
     operation_id="service_root",
+    response_model=None,
 )
-async def service_root() -> Dict[str, Any]:
+async def service_root() -> Response:
     """
     PUBLIC_INTERFACE
     Service root endpoint.
@@ -81,25 +149,18 @@ async def service_root() -> Dict[str, Any]:
     Returns:
         A JSON object containing the service name and version.
     """
-    return {"name": settings.APP_NAME, "version": settings.APP_VERSION}
+    return Response(content=_SERVICE_ROOT_BODY, media_type="application/json")
 
 
 # Non-prefixed "public" health endpoint (explicit requirement)
 app.include_router(health_router)
 
-# API routers mounted under API_PREFIX
-api_app = FastAPI(
-    title=settings.APP_NAME,
-    description="Modernized REST API backend (FastAPI) for the security operations platform.",
-    version=settings.APP_VERSION,
-    openapi_tags=OPENAPI_TAGS,
-)
-
-# Centralized error handling (RFC7807 problem+json)
-register_exception_handlers(api_app)
+# API routers under API_PREFIX: a prefixed router on the same app (no second FastAPI
+# instance, no Mount scope rewrite per request).
+api_router = APIRouter(prefix=settings.API_PREFIX)
 
 
-@api_app.get(
+@api_router.get(
     "/errors",
     summary="Error format (problem+json)",
     description=(
@@ -109,8 +170,9 @@ register_exception_handlers(api_app)
     ),
     tags=["Root"],
     operation_id="api_error_format",
+    response_model=None,
 )
-async def error_format_docs() -> Dict[str, Any]:
+async def error_format_docs() -> Response:
     """
     PUBLIC_INTERFACE
     Describe the global error envelope.
@@ -118,36 +180,23 @@ async def error_format_docs() -> Dict[str, Any]:
     Returns:
         A JSON object describing the RFC7807 `problem+json` envelope used by this API.
     """
-    return {
-        "media_type": "application/problem+json",
-        "fields": ["type", "title", "status", "detail", "instance", "errors?"],
-        "notes": [
-            "`errors` is included for validation failures (422) and contains FastAPI/Pydantic error objects.",
-            "`instance` is set to the request path.",
-        ],
-        "example": {
-            "type": "about:blank",
-            "title": "Not Found",
-            "status": 404,
-            "detail": "Resource not found.",
-            "instance": "/api/projects/00000000-0000-0000-0000-000000000000",
-        },
-    }
+    return Response(content=_ERROR_FORMAT_BODY, media_type="application/json")
+
 
 def _custom_openapi() -> Dict[str, Any]:
     """
-    Create OpenAPI schema for the prefixed API app with an HTTP bearer security scheme.
+    Create the OpenAPI schema with an HTTP bearer security scheme.
 
     This makes Swagger UI show an "Authorize" button for pasting Bearer access tokens.
     """
-    if api_app.openapi_schema:
-        return api_app.openapi_schema  # type: ignore[return-value]
+    if app.openapi_schema:
+        return app.openapi_schema  # type: ignore[return-value]
 
     schema = get_openapi(
-        title=api_app.title,
-        version=api_app.version,
-        description=api_app.description,
-        routes=api_app.routes,
+        title=app.title,
+        version=app.version,
+        description=app.description,
+        routes=app.routes,
         tags=OPENAPI_TAGS,
     )
 
@@ -163,20 +212,64 @@ def _custom_openapi() -> Dict[str, Any]:
         ),
     }
 
-    api_app.openapi_schema = schema  # type: ignore[assignment]
-    return api_app.openapi_schema  # type: ignore[return-value]
+    app.openapi_schema = schema  # type: ignore[assignment]
+    return app.openapi_schema  # type: ignore[return-value]
+
 
+app.openapi = _custom_openapi  # type: ignore[method-assign]
 
-api_app.openapi = _custom_openapi  # type: ignore[method-assign]
+_OPENAPI_JSON: Optional[bytes] = None
+
+
+async def _openapi_json(_request: Request) -> Response:
+    """
+    Serve the OpenAPI document from bytes serialized on first use.
+
+    Replaces FastAPI's built-in handler, which re-encodes the cached schema dict on every
+    request (Swagger UI and tooling fetch it repeatedly).
+    """
+    global _OPENAPI_JSON  # noqa: PLW0603
+    if _OPENAPI_JSON is None:
+        _OPENAPI_JSON = orjson.dumps(app.openapi())
+    return Response(content=_OPENAPI_JSON, media_type="application/json")
+
+
+if app.openapi_url:
+    for _index, _route in enumerate(app.router.routes):
+        if isinstance(_route, Route) and _route.path == app.openapi_url:
+            app.router.routes[_index] = Route(
+                app.openapi_url, _openapi_json, include_in_schema=False
+            )
+            break
 
 # Include requested routers under API prefix:
-api_app.include_router(api_routes_router)
-api_app.include_router(health_router)
-api_app.include_router(info_router)
-api_app.include_router(protected_router)
-api_app.include_router(projects_router)
-api_app.include_router(tasks_router)
-api_app.include_router(vulnerabilities_router)
-
-# Mount the API app under prefix
-app.mount(settings.API_PREFIX, api_app)
+api_router.include_router(api_routes_router)
+# Same handler as the public /health above, which already documents it.
+api_router.include_router(health_router, include_in_schema=False)
+api_router.include_router(info_router)
+api_router.include_router(protected_router)
+api_router.include_router(projects_router)
+api_router.include_router(tasks_router)
+api_router.include_router(vulnerabilities_router)
+
+app.include_router(api_router)
+
+
+# PUBLIC_INTERFACE
+def run() -> None:
+    """
+    PUBLIC_INTERFACE
+    Run the API with uvicorn, using the event loop selected by `EVENT_LOOP`.
+
+    Usage:
+        python -m app.main
+    """
+    import uvicorn
+
+    configure_event_loop(settings.EVENT_LOOP)
+    # loop="none": keep the policy installed above instead of letting uvicorn pick one.
+    uvicorn.run(app, host="0.0.0.0", port=settings.PORT, loop="none", http="httptools")
+
+
+if __name__ == "__main__":
+    run()
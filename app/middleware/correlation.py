@@ -3,24 +3,44 @@
 from __future__ import annotations
 
 import uuid
-from typing import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
-    """Injects a correlation ID into each request/response via `X-Request-Id`."""
+class CorrelationIdMiddleware:
+    """
+    Injects a correlation ID into each request/response via `X-Request-Id`.
+
+    A plain ASGI middleware: unlike `BaseHTTPMiddleware` it runs no extra task or memory
+    streams per request; it only adds the header to the `http.response.start` message.
+    """
 
     header_name: str = "X-Request-Id"
+    _header_key: bytes = header_name.lower().encode("latin-1")
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = ""
+        for key, value in scope["headers"]:
+            if key == self._header_key:
+                correlation_id = value.decode("latin-1")
+                break
+        # 32-char hex (no dashes): still a valid UUID, minus the formatting step.
+        correlation_id = correlation_id or uuid.uuid4().hex
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        correlation_id = request.headers.get(self.header_name) or str(uuid.uuid4())
+        # Expose to downstream handlers (`request.state.correlation_id`).
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
 
-        # Expose to downstream handlers.
-        request.state.correlation_id = correlation_id
+        async def send_with_correlation_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[self.header_name] = correlation_id
+            await send(message)
 
-        response = await call_next(request)
-        response.headers[self.header_name] = correlation_id
-        return response
+        await self.app(scope, receive, send_with_correlation_id)
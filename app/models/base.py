@@ -2,8 +2,36 @@
 
 from __future__ import annotations
 
+import os
+import time
+import uuid
+
 from sqlalchemy.orm import DeclarativeBase
 
 
+# PUBLIC_INTERFACE
+def uuid7() -> uuid.UUID:
+    """
+    PUBLIC_INTERFACE
+    Return a time-ordered UUID (RFC 9562 version 7) for primary keys.
+
+    The leading 48 bits are the Unix time in milliseconds, so new keys land at the right
+    edge of the primary-key B-tree instead of on random pages (as uuid4 does); the
+    remaining bits are random.
+
+    Returns:
+        A new version-7 UUID.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 9562 variant
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
+
+    # Fetch server-generated values (created_at/updated_at) via RETURNING on INSERT/UPDATE,
+    # so written objects are complete without a follow-up SELECT (refresh).
+    __mapper_args__ = {"eager_defaults": True}
@@ -6,20 +6,31 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, uuid7
 
 
 class Project(Base):
     """A security project (engagement)."""
 
     __tablename__ = "projects"
+    __table_args__ = (
+        # Newest-first list pages (offset or cursor) walk this index and stop at LIMIT.
+        Index("ix_projects_created_at", text("created_at DESC")),
+        # Trigram GIN index: serves the case-insensitive "contains" search (ILIKE '%q%').
+        Index(
+            "ix_projects_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
@@ -29,11 +40,14 @@ class Project(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
+    # Not loaded by default (the read schemas never include them); opt in per query with
+    # `selectinload(...)`. Deleting a project leaves the children to the FK's ON DELETE
+    # CASCADE (passive_deletes) instead of loading them just to delete them.
     tasks: Mapped[list["Task"]] = relationship(
-        back_populates="project", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="project", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
     )
     vulnerabilities: Mapped[list["Vulnerability"]] = relationship(
-        back_populates="project", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="project", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
     )
 
 
@@ -41,15 +55,28 @@ class Task(Base):
     """A task within a project (work item)."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Lists filtered by project_id AND status read rows in list order (newest first) and
+        # stop at LIMIT; a project_id-only filter uses the prefix but must sort. Also serves
+        # FK lookups on project_id.
+        Index("ix_tasks_project_status_created", "project_id", "status", text("created_at DESC")),
+        # Trigram GIN index: serves the case-insensitive "contains" search (ILIKE '%q%').
+        Index(
+            "ix_tasks_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     project_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), index=True, nullable=False
+        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
     )
 
-    title: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    status: Mapped[str] = mapped_column(String(50), nullable=False, index=True, default="open")
+    status: Mapped[str] = mapped_column(String(50), nullable=False, default="open")
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -58,23 +85,42 @@ class Task(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
-    project: Mapped[Project] = relationship(back_populates="tasks", lazy="selectin")
+    project: Mapped[Project] = relationship(back_populates="tasks", lazy="raise")
 
 
 class Vulnerability(Base):
     """A vulnerability (finding) within a project."""
 
     __tablename__ = "vulnerabilities"
+    __table_args__ = (
+        # Lists filtered by project_id, severity AND status read rows in list order (newest
+        # first) and stop at LIMIT; filters on a shorter prefix use it but must sort. Also
+        # serves FK lookups on project_id.
+        Index(
+            "ix_vulnerabilities_project_severity_status_created",
+            "project_id",
+            "severity",
+            "status",
+            text("created_at DESC"),
+        ),
+        # Trigram GIN index: serves the case-insensitive "contains" search (ILIKE '%q%').
+        Index(
+            "ix_vulnerabilities_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     project_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), index=True, nullable=False
+        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
     )
 
-    title: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    severity: Mapped[str] = mapped_column(String(30), nullable=False, index=True, default="medium")
-    status: Mapped[str] = mapped_column(String(50), nullable=False, index=True, default="open")
+    severity: Mapped[str] = mapped_column(String(30), nullable=False, default="medium")
+    status: Mapped[str] = mapped_column(String(50), nullable=False, default="open")
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -83,4 +129,4 @@ class Vulnerability(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
-    project: Mapped[Project] = relationship(back_populates="vulnerabilities", lazy="selectin")
+    project: Mapped[Project] = relationship(back_populates="vulnerabilities", lazy="raise")
@@ -2,48 +2,55 @@
 
 from __future__ import annotations
 
-OPENAPI_TAGS = [
-    {
-        "name": "Root",
-        "description": (
-            "Top-level endpoints (root, API root, and general documentation helpers). "
-            "All error responses use RFC7807 `application/problem+json`."
-        ),
-    },
-    {
-        "name": "Health",
-        "description": "Liveness/readiness endpoints for monitoring.",
-    },
-    {
-        "name": "Info",
-        "description": "Service metadata endpoints (name, version, runtime info).",
-    },
-    {
-        "name": "Auth",
-        "description": (
-            "Authentication/authorization helpers and protected example endpoints. "
-            "Use the Swagger UI 'Authorize' button to set `Bearer <token>`."
-        ),
-    },
-    {
-        "name": "Projects",
-        "description": (
-            "Project management (CRUD, filtering, pagination). "
-            "All endpoints require a Bearer token; write operations may require admin roles."
-        ),
-    },
-    {
-        "name": "Tasks",
-        "description": (
-            "Task management (CRUD, filtering, pagination). "
-            "All endpoints require a Bearer token; delete requires admin roles."
-        ),
-    },
-    {
-        "name": "Vulnerabilities",
-        "description": (
-            "Vulnerability management (CRUD, filtering, pagination). "
-            "All endpoints require a Bearer token; delete requires admin roles."
-        ),
-    },
-]
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+# Read-only: shared by the app and the custom OpenAPI builder, never mutated.
+OPENAPI_TAGS: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType(tag)
+    for tag in (
+        {
+            "name": "Root",
+            "description": (
+                "Top-level endpoints (root, API root, and general documentation helpers). "
+                "All error responses use RFC7807 `application/problem+json`."
+            ),
+        },
+        {
+            "name": "Health",
+            "description": "Liveness/readiness endpoints for monitoring.",
+        },
+        {
+            "name": "Info",
+            "description": "Service metadata endpoints (name, version, runtime info).",
+        },
+        {
+            "name": "Auth",
+            "description": (
+                "Authentication/authorization helpers and protected example endpoints. "
+                "Use the Swagger UI 'Authorize' button to set `Bearer <token>`."
+            ),
+        },
+        {
+            "name": "Projects",
+            "description": (
+                "Project management (CRUD, filtering, pagination). "
+                "All endpoints require a Bearer token; write operations may require admin roles."
+            ),
+        },
+        {
+            "name": "Tasks",
+            "description": (
+                "Task management (CRUD, filtering, pagination). "
+                "All endpoints require a Bearer token; delete requires admin roles."
+            ),
+        },
+        {
+            "name": "Vulnerabilities",
+            "description": (
+                "Vulnerability management (CRUD, filtering, pagination). "
+                "All endpoints require a Bearer token; delete requires admin roles."
+            ),
+        },
+    )
+)
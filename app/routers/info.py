@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any, Dict
+import orjson
+from fastapi import APIRouter, Depends, Response
 
-from fastapi import APIRouter, Depends
-
-from app.core.config import Settings, get_settings
+from app.common.clock import utc_timestamp
+from app.core.config import Settings
+from app.dependencies.settings import get_app_settings
 
 router = APIRouter(tags=["Info"])
 
@@ -17,8 +17,9 @@ router = APIRouter(tags=["Info"])
     summary="Service info",
     description="Returns service name, version, and a server timestamp.",
     operation_id="service_info",
+    response_model=None,
 )
-async def service_info(settings: Settings = Depends(get_settings)) -> Dict[str, Any]:
+async def service_info(settings: Settings = Depends(get_app_settings)) -> Response:
     """
     PUBLIC_INTERFACE
     Service metadata endpoint.
@@ -29,9 +30,12 @@ async def service_info(settings: Settings = Depends(get_settings)) -> Dict[str,
     Returns:
         JSON object containing service metadata.
     """
-    return {
-        "name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "api_prefix": settings.API_PREFIX,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+    body = orjson.dumps(
+        {
+            "name": settings.APP_NAME,
+            "version": settings.APP_VERSION,
+            "api_prefix": settings.API_PREFIX,
+            "timestamp": utc_timestamp(),
+        }
+    )
+    return Response(content=body, media_type="application/json")
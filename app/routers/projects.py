@@ -5,13 +5,20 @@ from __future__ import annotations
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Security, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request, Response, Security, status
 
-from app.auth.dependencies import AuthenticatedUser, get_current_user, require_roles
+from app.auth.dependencies import AuthenticatedUser, get_current_user, require_admin
 from app.common.errors import COMMON_ERROR_RESPONSES
-from app.dependencies.db import get_db_session
-from app.domain.schemas import ListResponse, ProjectCreate, ProjectRead, ProjectUpdate
+from app.common.pagination import PaginationParams, next_cursor, pagination_params
+from app.common.responses import conditional_model_response, model_response, model_responses
+from app.dependencies.services import get_project_service
+from app.domain.schemas import (
+    ListResponse,
+    ProjectCreate,
+    ProjectRead,
+    ProjectReadListAdapter,
+    ProjectUpdate,
+)
 from app.domain.services import ProjectService
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
@@ -22,16 +29,16 @@ router = APIRouter(prefix="/projects", tags=["Projects"])
     summary="Create project",
     description="Create a new project (admin only).",
     operation_id="projects_create",
-    response_model=ProjectRead,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
-    responses=COMMON_ERROR_RESPONSES,
+    responses=model_responses(ProjectRead, status_code=status.HTTP_201_CREATED),
     security=[{"BearerAuth": []}],
 )
 async def create_project(
     payload: ProjectCreate,
-    db: AsyncSession = Depends(get_db_session),
-    user: AuthenticatedUser = Depends(require_roles(["admin", "realm-admin"])),
-) -> ProjectRead:
+    svc: ProjectService = Depends(get_project_service),
+    user: AuthenticatedUser = Depends(require_admin),
+) -> Response:
     """
     PUBLIC_INTERFACE
     Create a project.
@@ -48,9 +55,8 @@ async def create_project(
     Returns:
         The created project.
     """
-    svc = ProjectService(db)
     project = await svc.create(user=user, name=payload.name, description=payload.description)
-    return ProjectRead.model_validate(project)
+    return model_response(ProjectRead.model_validate(project), status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -58,17 +64,16 @@ async def create_project(
     summary="List projects",
     description="List projects with pagination and optional text search.",
     operation_id="projects_list",
-    response_model=ListResponse[ProjectRead],
-    responses=COMMON_ERROR_RESPONSES,
+    response_model=None,
+    responses=model_responses(ListResponse[ProjectRead]),
     security=[{"BearerAuth": []}],
 )
 async def list_projects(
-    limit: int = Query(default=50, ge=1, le=500, description="Maximum number of items to return."),
-    offset: int = Query(default=0, ge=0, description="Number of items to skip."),
+    page: PaginationParams = Depends(pagination_params),
     q: Optional[str] = Query(default=None, description="Optional name search (case-insensitive, contains)."),
-    db: AsyncSession = Depends(get_db_session),
+    svc: ProjectService = Depends(get_project_service),
     _user: AuthenticatedUser = Security(get_current_user),
-) -> ListResponse[ProjectRead]:
+) -> Response:
     """
     PUBLIC_INTERFACE
     List projects.
@@ -76,14 +81,17 @@ async def list_projects(
     Returns:
         A paginated list envelope.
     """
-    svc = ProjectService(db)
-    items, total = await svc.list(limit=limit, offset=offset, q=q)
-    return ListResponse[ProjectRead](
-        items=[ProjectRead.model_validate(p) for p in items],
+    items, total = await svc.list(limit=page.limit, offset=page.offset, q=q, after=page.after)
+    # Items are validated in bulk and the envelope fields are already known-good, so the
+    # envelope is built without validation and serialized once (no response_model pass).
+    body = ListResponse[ProjectRead].model_construct(
+        items=ProjectReadListAdapter.validate_python(items, from_attributes=True),
         total=total,
-        limit=limit,
-        offset=offset,
+        limit=page.limit,
+        offset=page.offset,
+        next_cursor=next_cursor(items, page.limit),
     )
+    return model_response(body)
 
 
 @router.get(
@@ -91,28 +99,28 @@ async def list_projects(
     summary="Get project",
     description="Get a project by id.",
     operation_id="projects_get",
-    response_model=ProjectRead,
-    responses=COMMON_ERROR_RESPONSES,
+    response_model=None,
+    responses=model_responses(ProjectRead),
     security=[{"BearerAuth": []}],
 )
 async def get_project(
+    request: Request,
     project_id: UUID,
-    db: AsyncSession = Depends(get_db_session),
+    svc: ProjectService = Depends(get_project_service),
     _user: AuthenticatedUser = Security(get_current_user),
-) -> ProjectRead:
+) -> Response:
     """
     PUBLIC_INTERFACE
     Get a project by id.
 
     Returns:
-        The project.
+        The project; 304 Not Modified (no body) if If-None-Match matches its ETag.
 
     Errors:
         - 404 (problem+json): if the project does not exist.
     """
-    svc = ProjectService(db)
     project = await svc.get(project_id=project_id)
-    return ProjectRead.model_validate(project)
+    return conditional_model_response(request, project, ProjectRead)
 
 
 @router.patch(
@@ -120,16 +128,16 @@ async def get_project(
     summary="Update project",
     description="Update a project (admin only).",
     operation_id="projects_update",
-    response_model=ProjectRead,
-    responses=COMMON_ERROR_RESPONSES,
+    response_model=None,
+    responses=model_responses(ProjectRead),
     security=[{"BearerAuth": []}],
 )
 async def update_project(
     project_id: UUID,
     payload: ProjectUpdate,
-    db: AsyncSession = Depends(get_db_session),
-    user: AuthenticatedUser = Depends(require_roles(["admin", "realm-admin"])),
-) -> ProjectRead:
+    svc: ProjectService = Depends(get_project_service),
+    user: AuthenticatedUser = Depends(require_admin),
+) -> Response:
     """
     PUBLIC_INTERFACE
     Update a project by id (partial update).
@@ -147,14 +155,13 @@ async def update_project(
         - 404 (problem+json): if the project does not exist.
         - 403 (problem+json): if the user lacks required roles.
     """
-    svc = ProjectService(db)
     project = await svc.update(
         user=user,
         project_id=project_id,
         name=payload.name,
         description=payload.description,
     )
-    return ProjectRead.model_validate(project)
+    return model_response(ProjectRead.model_validate(project))
 
 
 @router.delete(
@@ -163,14 +170,16 @@ async def update_project(
     description="Delete a project (admin only).",
     operation_id="projects_delete",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    response_model=None,
     responses=COMMON_ERROR_RESPONSES,
     security=[{"BearerAuth": []}],
 )
 async def delete_project(
     project_id: UUID,
-    db: AsyncSession = Depends(get_db_session),
-    user: AuthenticatedUser = Depends(require_roles(["admin", "realm-admin"])),
-) -> None:
+    svc: ProjectService = Depends(get_project_service),
+    user: AuthenticatedUser = Depends(require_admin),
+) -> Response:
     """
     PUBLIC_INTERFACE
     Delete a project by id.
@@ -179,12 +188,11 @@ async def delete_project(
         Requires role: admin OR realm-admin.
 
     Returns:
-        None.
+        An empty 204 response.
 
     Errors:
         - 404 (problem+json): if the project does not exist.
         - 403 (problem+json): if the user lacks required roles.
     """
-    svc = ProjectService(db)
     await svc.delete(user=user, project_id=project_id)
-    return None
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
-
 from fastapi import APIRouter, Depends, Security
+from fastapi.responses import ORJSONResponse
 
 from app.auth.dependencies import AuthenticatedUser, get_current_user, require_roles
 from app.common.errors import COMMON_ERROR_RESPONSES
 
 router = APIRouter(tags=["Auth"])
 
+# These endpoints return an ORJSONResponse directly (response_model=None): the bodies are
+# small dicts of already-typed values, so the `Dict[str, Any]` response-model pass FastAPI
+# would otherwise run on each call validates nothing.
+
 
 @router.get(
     "/me",
@@ -19,8 +22,9 @@ router = APIRouter(tags=["Auth"])
     operation_id="auth_me",
     responses=COMMON_ERROR_RESPONSES,
     security=[{"BearerAuth": []}],
+    response_model=None,
 )
-async def me(user: AuthenticatedUser = Security(get_current_user)) -> Dict[str, Any]:
+async def me(user: AuthenticatedUser = Security(get_current_user)) -> ORJSONResponse:
     """
     PUBLIC_INTERFACE
     Minimal authenticated endpoint.
@@ -31,14 +35,16 @@ async def me(user: AuthenticatedUser = Security(get_current_user)) -> Dict[str,
     Returns:
         Basic identity fields and roles extracted from the token.
     """
-    return {
-        "subject": user.subject,
-        "username": user.username,
-        "email": user.email,
-        "roles": sorted(user.roles),
-        "issuer": user.issuer,
-        "audience": user.audience,
-    }
+    return ORJSONResponse(
+        {
+            "subject": user.subject,
+            "username": user.username,
+            "email": user.email,
+            "roles": user.roles_sorted,
+            "issuer": user.issuer,
+            "audience": user.audience,
+        }
+    )
 
 
 @router.get(
@@ -48,8 +54,9 @@ async def me(user: AuthenticatedUser = Security(get_current_user)) -> Dict[str,
     operation_id="protected_example",
     responses=COMMON_ERROR_RESPONSES,
     security=[{"BearerAuth": []}],
+    response_model=None,
 )
-async def protected_example(user: AuthenticatedUser = Security(get_current_user)) -> Dict[str, Any]:
+async def protected_example(user: AuthenticatedUser = Security(get_current_user)) -> ORJSONResponse:
     """
     PUBLIC_INTERFACE
     Example protected endpoint.
@@ -60,13 +67,15 @@ async def protected_example(user: AuthenticatedUser = Security(get_current_user)
     Returns:
         A JSON object with user identity and roles extracted from the token.
     """
-    return {
-        "subject": user.subject,
-        "username": user.username,
-        "email": user.email,
-        "roles": sorted(user.roles),
-        "issuer": user.issuer,
-    }
+    return ORJSONResponse(
+        {
+            "subject": user.subject,
+            "username": user.username,
+            "email": user.email,
+            "roles": user.roles_sorted,
+            "issuer": user.issuer,
+        }
+    )
 
 
 @router.get(
@@ -76,10 +85,11 @@ async def protected_example(user: AuthenticatedUser = Security(get_current_user)
     operation_id="protected_admin_example",
     responses=COMMON_ERROR_RESPONSES,
     security=[{"BearerAuth": []}],
+    response_model=None,
 )
 async def protected_admin_example(
     user: AuthenticatedUser = Depends(require_roles(["admin", "realm-admin"])),
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     PUBLIC_INTERFACE
     Example role-protected endpoint.
@@ -90,4 +100,4 @@ async def protected_admin_example(
     Returns:
         A JSON object confirming authorization.
     """
-    return {"ok": True, "subject": user.subject, "roles": sorted(user.roles)}
+    return ORJSONResponse({"ok": True, "subject": user.subject, "roles": user.roles_sorted})
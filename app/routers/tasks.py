@@ -5,13 +5,14 @@ from __future__ import annotations
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Security, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request, Response, Security, status
 
-from app.auth.dependencies import AuthenticatedUser, get_current_user, require_roles
+from app.auth.dependencies import AuthenticatedUser, get_current_user, require_admin
 from app.common.errors import COMMON_ERROR_RESPONSES
-from app.dependencies.db import get_db_session
-from app.domain.schemas import ListResponse, TaskCreate, TaskRead, TaskUpdate
+from app.common.pagination import PaginationParams, next_cursor, pagination_params
+from app.common.responses import conditional_model_response, model_response, model_responses
+from app.dependencies.services import get_task_service
+from app.domain.schemas import ListResponse, TaskCreate, TaskRead, TaskReadListAdapter, TaskUpdate
 from app.domain.services import TaskService
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
@@ -22,16 +23,16 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"])
     summary="Create task",
     description="Create a new task.",
     operation_id="tasks_create",
-    response_model=TaskRead,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
-    responses=COMMON_ERROR_RESPONSES,
+    responses=model_responses(TaskRead, status_code=status.HTTP_201_CREATED),
     security=[{"BearerAuth": []}],
 )
 async def create_task(
     payload: TaskCreate,
-    db: AsyncSession = Depends(get_db_session),
+    svc: TaskService = Depends(get_task_service),
     user: AuthenticatedUser = Security(get_current_user),
-) -> TaskRead:
+) -> Response:
     """
     PUBLIC_INTERFACE
     Create a task.
@@ -50,7 +51,6 @@ async def create_task(
     Errors:
         - 404 (problem+json): if the referenced project does not exist.
     """
-    svc = TaskService(db)
     task = await svc.create(
         user=user,
         project_id=payload.project_id,
@@ -58,7 +58,7 @@ async def create_task(
         description=payload.description,
         status=payload.status,
     )
-    return TaskRead.model_validate(task)
+    return model_response(TaskRead.model_validate(task), status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -66,19 +66,18 @@ async def create_task(
     summary="List tasks",
     description="List tasks with pagination and optional filtering.",
     operation_id="tasks_list",
-    response_model=ListResponse[TaskRead],
-    responses=COMMON_ERROR_RESPONSES,
+    response_model=None,
+    responses=model_responses(ListResponse[TaskRead]),
     security=[{"BearerAuth": []}],
 )
 async def list_tasks(
-    limit: int = Query(default=50, ge=1, le=500, description="Maximum number of items to return."),
-    offset: int = Query(default=0, ge=0, description="Number of items to skip."),
+    page: PaginationParams = Depends(pagination_params),
     project_id: Optional[UUID] = Query(default=None, description="Filter by project id."),
     status_filter: Optional[str] = Query(default=None, alias="status", description="Filter by status."),
     q: Optional[str] = Query(default=None, description="Optional title search (case-insensitive, contains)."),
-    db: AsyncSession = Depends(get_db_session),
+    svc: TaskService = Depends(get_task_service),
     _user: AuthenticatedUser = Security(get_current_user),
-) -> ListResponse[TaskRead]:
+) -> Response:
     """
     PUBLIC_INTERFACE
     List tasks.
@@ -86,20 +85,24 @@ async def list_tasks(
     Returns:
         A paginated list envelope.
     """
-    svc = TaskService(db)
     items, total = await svc.list(
-        limit=limit,
-        offset=offset,
+        limit=page.limit,
+        offset=page.offset,
         project_id=project_id,
         status=status_filter,
         q=q,
+        after=page.after,
     )
-    return ListResponse[TaskRead](
-        items=[TaskRead.model_validate(t) for t in items],
+    # Items are validated in bulk and the envelope fields are already known-good, so the
+    # envelope is built without validation and serialized once (no response_model pass).
+    body = ListResponse[TaskRead].model_construct(
+        items=TaskReadListAdapter.validate_python(items, from_attributes=True),
         total=total,
-        limit=limit,
-        offset=offset,
+        limit=page.limit,
+        offset=page.offset,
+        next_cursor=next_cursor(items, page.limit),
     )
+    return model_response(body)
 
 
 @router.get(
@@ -107,28 +110,28 @@ async def list_tasks(
     summary="Get task",
     description="Get a task by id.",
     operation_id="tasks_get",
-    response_model=TaskRead,
-    responses=COMMON_ERROR_RESPONSES,
+    response_model=None,
+    responses=model_responses(TaskRead),
     security=[{"BearerAuth": []}],
 )
 async def get_task(
+    request: Request,
     task_id: UUID,
-    db: AsyncSession = Depends(get_db_session),
+    svc: TaskService = Depends(get_task_service),
     _user: AuthenticatedUser = Security(get_current_user),
-) -> TaskRead:
+) -> Response:
     """
     PUBLIC_INTERFACE
     Get a task by id.
 
     Returns:
-        The task.
+        The task; 304 Not Modified (no body) if If-None-Match matches its ETag.
 
     Errors:
         - 404 (problem+json): if the task does not exist.
     """
-    svc = TaskService(db)
     task = await svc.get(task_id=task_id)
-    return TaskRead.model_validate(task)
+    return conditional_model_response(request, task, TaskRead)
 
 
 @router.patch(
@@ -136,16 +139,16 @@ async def get_task(
     summary="Update task",
     description="Update a task (partial).",
     operation_id="tasks_update",
-    response_model=TaskRead,
-    responses=COMMON_ERROR_RESPONSES,
+    response_model=None,
+    responses=model_responses(TaskRead),
     security=[{"BearerAuth": []}],
 )
 async def update_task(
     task_id: UUID,
     payload: TaskUpdate,
-    db: AsyncSession = Depends(get_db_session),
+    svc: TaskService = Depends(get_task_service),
     user: AuthenticatedUser = Security(get_current_user),
-) -> TaskRead:
+) -> Response:
     """
     PUBLIC_INTERFACE
     Update a task by id (partial update).
@@ -159,7 +162,6 @@ async def update_task(
     Errors:
         - 404 (problem+json): if the task does not exist.
     """
-    svc = TaskService(db)
     task = await svc.update(
         user=user,
         task_id=task_id,
@@ -167,7 +169,7 @@ async def update_task(
         description=payload.description,
         status=payload.status,
     )
-    return TaskRead.model_validate(task)
+    return model_response(TaskRead.model_validate(task))
 
 
 @router.delete(
@@ -176,14 +178,16 @@ async def update_task(
     description="Delete a task (admin only).",
     operation_id="tasks_delete",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    response_model=None,
     responses=COMMON_ERROR_RESPONSES,
     security=[{"BearerAuth": []}],
 )
 async def delete_task(
     task_id: UUID,
-    db: AsyncSession = Depends(get_db_session),
-    user: AuthenticatedUser = Depends(require_roles(["admin", "realm-admin"])),
-) -> None:
+    svc: TaskService = Depends(get_task_service),
+    user: AuthenticatedUser = Depends(require_admin),
+) -> Response:
     """
     PUBLIC_INTERFACE
     Delete a task by id.
@@ -192,12 +196,11 @@ async def delete_task(
         Requires role: admin OR realm-admin.
 
     Returns:
-        None.
+        An empty 204 response.
 
     Errors:
         - 404 (problem+json): if the task does not exist.
         - 403 (problem+json): if the user lacks required roles.
     """
-    svc = TaskService(db)
     await svc.delete(user=user, task_id=task_id)
-    return None
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -5,16 +5,18 @@ from __future__ import annotations
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Security, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request, Response, Security, status
 
-from app.auth.dependencies import AuthenticatedUser, get_current_user, require_roles
+from app.auth.dependencies import AuthenticatedUser, get_current_user, require_admin
 from app.common.errors import COMMON_ERROR_RESPONSES
-from app.dependencies.db import get_db_session
+from app.common.pagination import PaginationParams, next_cursor, pagination_params
+from app.common.responses import conditional_model_response, model_response, model_responses
+from app.dependencies.services import get_vulnerability_service
 from app.domain.schemas import (
     ListResponse,
     VulnerabilityCreate,
     VulnerabilityRead,
+    VulnerabilityReadListAdapter,
     VulnerabilityUpdate,
 )
 from app.domain.services import VulnerabilityService
@@ -27,16 +29,16 @@ router = APIRouter(prefix="/vulnerabilities", tags=["Vulnerabilities"])
     summary="Create vulnerability",
     description="Create a new vulnerability (finding).",
     operation_id="vulnerabilities_create",
-    response_model=VulnerabilityRead,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
-    responses=COMMON_ERROR_RESPONSES,
+    responses=model_responses(VulnerabilityRead, status_code=status.HTTP_201_CREATED),
     security=[{"BearerAuth": []}],
 )
 async def create_vulnerability(
     payload: VulnerabilityCreate,
-    db: AsyncSession = Depends(get_db_session),
+    svc: VulnerabilityService = Depends(get_vulnerability_service),
     user: AuthenticatedUser = Security(get_current_user),
-) -> VulnerabilityRead:
+) -> Response:
     """
     PUBLIC_INTERFACE
     Create a vulnerability.
@@ -56,7 +58,6 @@ async def create_vulnerability(
     Errors:
         - 404 (problem+json): if the referenced project does not exist.
     """
-    svc = VulnerabilityService(db)
     vuln = await svc.create(
         user=user,
         project_id=payload.project_id,
@@ -65,7 +66,9 @@ async def create_vulnerability(
         severity=payload.severity,
         status=payload.status,
     )
-    return VulnerabilityRead.model_validate(vuln)
+    return model_response(
+        VulnerabilityRead.model_validate(vuln), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get(
@@ -73,20 +76,19 @@ async def create_vulnerability(
     summary="List vulnerabilities",
     description="List vulnerabilities with pagination and optional filtering.",
     operation_id="vulnerabilities_list",
-    response_model=ListResponse[VulnerabilityRead],
-    responses=COMMON_ERROR_RESPONSES,
+    response_model=None,
+    responses=model_responses(ListResponse[VulnerabilityRead]),
     security=[{"BearerAuth": []}],
 )
 async def list_vulnerabilities(
-    limit: int = Query(default=50, ge=1, le=500, description="Maximum number of items to return."),
-    offset: int = Query(default=0, ge=0, description="Number of items to skip."),
+    page: PaginationParams = Depends(pagination_params),
     project_id: Optional[UUID] = Query(default=None, description="Filter by project id."),
     severity: Optional[str] = Query(default=None, description="Filter by severity."),
     status_filter: Optional[str] = Query(default=None, alias="status", description="Filter by status."),
     q: Optional[str] = Query(default=None, description="Optional title search (case-insensitive, contains)."),
-    db: AsyncSession = Depends(get_db_session),
+    svc: VulnerabilityService = Depends(get_vulnerability_service),
     _user: AuthenticatedUser = Security(get_current_user),
-) -> ListResponse[VulnerabilityRead]:
+) -> Response:
     """
     PUBLIC_INTERFACE
     List vulnerabilities.
@@ -94,21 +96,25 @@ async def list_vulnerabilities(
     Returns:
         A paginated list envelope.
     """
-    svc = VulnerabilityService(db)
     items, total = await svc.list(
-        limit=limit,
-        offset=offset,
+        limit=page.limit,
+        offset=page.offset,
         project_id=project_id,
         severity=severity,
         status=status_filter,
         q=q,
+        after=page.after,
     )
-    return ListResponse[VulnerabilityRead](
-        items=[VulnerabilityRead.model_validate(v) for v in items],
+    # Items are validated in bulk and the envelope fields are already known-good, so the
+    # envelope is built without validation and serialized once (no response_model pass).
+    body = ListResponse[VulnerabilityRead].model_construct(
+        items=VulnerabilityReadListAdapter.validate_python(items, from_attributes=True),
         total=total,
-        limit=limit,
-        offset=offset,
+        limit=page.limit,
+        offset=page.offset,
+        next_cursor=next_cursor(items, page.limit),
     )
+    return model_response(body)
 
 
 @router.get(
@@ -116,28 +122,28 @@ async def list_vulnerabilities(
     summary="Get vulnerability",
     description="Get a vulnerability by id.",
     operation_id="vulnerabilities_get",
-    response_model=VulnerabilityRead,
-    responses=COMMON_ERROR_RESPONSES,
+    response_model=None,
+    responses=model_responses(VulnerabilityRead),
     security=[{"BearerAuth": []}],
 )
 async def get_vulnerability(
+    request: Request,
     vulnerability_id: UUID,
-    db: AsyncSession = Depends(get_db_session),
+    svc: VulnerabilityService = Depends(get_vulnerability_service),
     _user: AuthenticatedUser = Security(get_current_user),
-) -> VulnerabilityRead:
+) -> Response:
     """
     PUBLIC_INTERFACE
     Get a vulnerability by id.
 
     Returns:
-        The vulnerability.
+        The vulnerability; 304 Not Modified (no body) if If-None-Match matches its ETag.
 
     Errors:
         - 404 (problem+json): if the vulnerability does not exist.
     """
-    svc = VulnerabilityService(db)
     vuln = await svc.get(vulnerability_id=vulnerability_id)
-    return VulnerabilityRead.model_validate(vuln)
+    return conditional_model_response(request, vuln, VulnerabilityRead)
 
 
 @router.patch(
@@ -145,16 +151,16 @@ async def get_vulnerability(
     summary="Update vulnerability",
     description="Update a vulnerability (partial).",
     operation_id="vulnerabilities_update",
-    response_model=VulnerabilityRead,
-    responses=COMMON_ERROR_RESPONSES,
+    response_model=None,
+    responses=model_responses(VulnerabilityRead),
     security=[{"BearerAuth": []}],
 )
 async def update_vulnerability(
     vulnerability_id: UUID,
     payload: VulnerabilityUpdate,
-    db: AsyncSession = Depends(get_db_session),
+    svc: VulnerabilityService = Depends(get_vulnerability_service),
     user: AuthenticatedUser = Security(get_current_user),
-) -> VulnerabilityRead:
+) -> Response:
     """
     PUBLIC_INTERFACE
     Update a vulnerability by id (partial update).
@@ -168,7 +174,6 @@ async def update_vulnerability(
     Errors:
         - 404 (problem+json): if the vulnerability does not exist.
     """
-    svc = VulnerabilityService(db)
     vuln = await svc.update(
         user=user,
         vulnerability_id=vulnerability_id,
@@ -177,7 +182,7 @@ async def update_vulnerability(
         severity=payload.severity,
         status=payload.status,
     )
-    return VulnerabilityRead.model_validate(vuln)
+    return model_response(VulnerabilityRead.model_validate(vuln))
 
 
 @router.delete(
@@ -186,14 +191,16 @@ async def update_vulnerability(
     description="Delete a vulnerability (admin only).",
     operation_id="vulnerabilities_delete",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    response_model=None,
     responses=COMMON_ERROR_RESPONSES,
     security=[{"BearerAuth": []}],
 )
 async def delete_vulnerability(
     vulnerability_id: UUID,
-    db: AsyncSession = Depends(get_db_session),
-    user: AuthenticatedUser = Depends(require_roles(["admin", "realm-admin"])),
-) -> None:
+    svc: VulnerabilityService = Depends(get_vulnerability_service),
+    user: AuthenticatedUser = Depends(require_admin),
+) -> Response:
     """
     PUBLIC_INTERFACE
     Delete a vulnerability by id.
@@ -202,12 +209,11 @@ async def delete_vulnerability(
         Requires role: admin OR realm-admin.
 
     Returns:
-        None.
+        An empty 204 response.
 
     Errors:
         - 404 (problem+json): if the vulnerability does not exist.
         - 403 (problem+json): if the user lacks required roles.
     """
-    svc = VulnerabilityService(db)
     await svc.delete(user=user, vulnerability_id=vulnerability_id)
-    return None
+    return Response(status_code=status.HTTP_204_NO_CONTENT)